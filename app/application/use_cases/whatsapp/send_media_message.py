@@ -67,6 +67,35 @@ class SendMediaMessageUseCase:
         """
         self.client = client or WhatsAppClient()
 
+    def _validate(self, request: SendMediaMessageRequest) -> Optional[str]:
+        """
+        Validate the request before uploading or sending anything.
+
+        Args:
+            request: Send media message request
+
+        Returns:
+            Error message, or None if the request is valid
+        """
+        # Validate media type
+        valid_types = ['image', 'video', 'document', 'audio', 'sticker']
+        if request.media_type not in valid_types:
+            return f"Invalid media_type. Must be one of: {valid_types}"
+
+        # Validate phone number
+        if not request.to.startswith('+'):
+            return f"Phone number must be in E.164 format: {request.to}"
+
+        # Validate caption length
+        if request.caption and len(request.caption) > 1024:
+            return "Media caption cannot exceed 1024 characters"
+
+        # Uploads need a MIME type and filename
+        if request.media_data and (not request.mime_type or not request.filename):
+            return "mime_type and filename are required when uploading media"
+
+        return None
+
     async def execute(
         self,
         request: SendMediaMessageRequest
@@ -81,27 +110,9 @@ class SendMediaMessageUseCase:
             Response with message ID and media ID or error
         """
         try:
-            # Validate media type
-            valid_types = ['image', 'video', 'document', 'audio', 'sticker']
-            if request.media_type not in valid_types:
-                return SendMediaMessageResponse(
-                    success=False,
-                    error=f"Invalid media_type. Must be one of: {valid_types}"
-                )
-
-            # Validate phone number
-            if not request.to.startswith('+'):
-                return SendMediaMessageResponse(
-                    success=False,
-                    error=f"Phone number must be in E.164 format: {request.to}"
-                )
-
-            # Validate caption length
-            if request.caption and len(request.caption) > 1024:
-                return SendMediaMessageResponse(
-                    success=False,
-                    error="Media caption cannot exceed 1024 characters"
-                )
+            error = self._validate(request)
+            if error:
+                return SendMediaMessageResponse(success=False, error=error)
 
             # Determine media source
             media_id = request.media_id
@@ -109,12 +120,6 @@ class SendMediaMessageUseCase:
 
             # If media_data is provided, upload it first
             if request.media_data:
-                if not request.mime_type or not request.filename:
-                    return SendMediaMessageResponse(
-                        success=False,
-                        error="mime_type and filename are required when uploading media"
-                    )
-
                 media_id = await self.client.upload_media(
                     file_data=request.media_data,
                     mime_type=request.mime_type,
@@ -61,6 +61,26 @@ class SendTemplateMessageUseCase:
         """
         self.client = client or WhatsAppClient()
 
+    def _validate(self, request: SendTemplateMessageRequest) -> Optional[str]:
+        """
+        Validate the request before calling the API.
+
+        Args:
+            request: Send template message request
+
+        Returns:
+            Error message, or None if the request is valid
+        """
+        # Validate phone number
+        if not request.to.startswith('+'):
+            return f"Phone number must be in E.164 format: {request.to}"
+
+        # Validate template name
+        if not request.template_name:
+            return "template_name is required"
+
+        return None
+
     async def execute(
         self,
         request: SendTemplateMessageRequest
@@ -75,19 +95,9 @@ class SendTemplateMessageUseCase:
             Response with message ID or error
         """
         try:
-            # Validate phone number
-            if not request.to.startswith('+'):
-                return SendTemplateMessageResponse(
-                    success=False,
-                    error=f"Phone number must be in E.164 format: {request.to}"
-                )
-
-            # Validate template name
-            if not request.template_name:
-                return SendTemplateMessageResponse(
-                    success=False,
-                    error="template_name is required"
-                )
+            error = self._validate(request)
+            if error:
+                return SendTemplateMessageResponse(success=False, error=error)
 
             # Send template message
             message_id = await self.client.send_template_message(
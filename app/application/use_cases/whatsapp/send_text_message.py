@@ -56,6 +56,26 @@ class SendTextMessageUseCase:
         """
         self.client = client or WhatsAppClient()
 
+    def _validate(self, request: SendTextMessageRequest) -> Optional[str]:
+        """
+        Validate the request before calling the API.
+
+        Args:
+            request: Send text message request
+
+        Returns:
+            Error message, or None if the request is valid
+        """
+        # Validate text length
+        if len(request.text) > 4096:
+            return "Text message cannot exceed 4096 characters"
+
+        # Validate phone number format
+        if not request.to.startswith('+'):
+            return f"Phone number must be in E.164 format (start with +): {request.to}"
+
+        return None
+
     async def execute(
         self,
         request: SendTextMessageRequest
@@ -70,19 +90,9 @@ class SendTextMessageUseCase:
             Response with message ID or error
         """
         try:
-            # Validate text length
-            if len(request.text) > 4096:
-                return SendTextMessageResponse(
-                    success=False,
-                    error="Text message cannot exceed 4096 characters"
-                )
-
-            # Validate phone number format
-            if not request.to.startswith('+'):
-                return SendTextMessageResponse(
-                    success=False,
-                    error=f"Phone number must be in E.164 format (start with +): {request.to}"
-                )
+            error = self._validate(request)
+            if error:
+                return SendTextMessageResponse(success=False, error=error)
 
             # Send message
             message_id = await self.client.send_text_message(
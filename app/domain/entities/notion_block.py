@@ -7,7 +7,7 @@ from typing import Optional, Any
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class NotionBlock:
     """
     Notion block (content element).
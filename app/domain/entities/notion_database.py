@@ -38,7 +38,7 @@ class NotionDatabase:
         return list(self.properties.keys())
 
 
-@dataclass
+@dataclass(slots=True)
 class NotionDatabaseEntry:
     """
     Entry (page) in a Notion database.
@@ -7,7 +7,7 @@ from typing import Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class NotionPage:
     """
     Notion page entity representing a page in workspace.
@@ -2,13 +2,20 @@
 Gmail OAuth2 authentication handler with multi-account support.
 """
 import os
+import tempfile
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
+from google.auth.exceptions import RefreshError, TransportError
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
 from app.config.settings import settings
 
+# Google access tokens are valid for one hour. Refresh once less than 20% of
+# that lifetime remains so requests never race an expiring token.
+TOKEN_LIFETIME = timedelta(hours=1)
+REFRESH_MARGIN = TOKEN_LIFETIME * 0.2
+
 
 class GmailOAuthHandler:
     """Handles OAuth2 authentication for Gmail API with multi-account support."""
@@ -57,45 +64,93 @@ class GmailOAuthHandler:
             FileNotFoundError: If credentials file is not found
             ValueError: If credentials cannot be obtained
         """
+        # Reuse credentials loaded by a previous call while they are valid
+        if self._creds and self._creds.valid and not self._expires_soon(self._creds):
+            return self._creds
+
         # Load existing token if available
-        if self.token_file.exists():
+        if self._creds is None and self.token_file.exists():
             self._creds = Credentials.from_authorized_user_file(
                 str(self.token_file),
                 self.scopes
             )
 
-        # Refresh or get new credentials if needed
-        if not self._creds or not self._creds.valid:
-            if self._creds and self._creds.expired and self._creds.refresh_token:
-                # Refresh expired credentials
+        # Refresh expired or soon-to-expire credentials when possible
+        if (
+            self._creds
+            and self._creds.refresh_token
+            and (self._creds.expired or self._expires_soon(self._creds))
+        ):
+            try:
                 self._creds.refresh(Request())
-            else:
-                # Get new credentials through OAuth flow
-                if not self.credentials_file or not self.credentials_file.exists():
-                    raise FileNotFoundError(
-                        f"Credentials file not found: {self.credentials_file}. "
-                        "Please download it from Google Cloud Console."
-                    )
-
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    str(self.credentials_file),
-                    self.scopes
+            except (RefreshError, TransportError):
+                # Refreshing early is best effort; keep using a token that has
+                # not expired yet and only fail once it no longer works
+                if not self._creds.valid:
+                    raise
+                return self._creds
+            self._save_credentials()
+        elif not self._creds or not self._creds.valid:
+            # Get new credentials through OAuth flow; a still-valid token that
+            # cannot be refreshed early is used until it expires
+            if not self.credentials_file or not self.credentials_file.exists():
+                raise FileNotFoundError(
+                    f"Credentials file not found: {self.credentials_file}. "
+                    "Please download it from Google Cloud Console."
                 )
-                print(f"\nAuthenticating account: {self.account_id}")
-                print("Please follow the browser instructions to authorize access.\n")
-                self._creds = flow.run_local_server(port=0)
+
+            # Only needed for first-time authorization; importing
+            # google_auth_oauthlib pulls in requests_oauthlib and oauthlib
+            from google_auth_oauthlib.flow import InstalledAppFlow
+
+            flow = InstalledAppFlow.from_client_secrets_file(
+                str(self.credentials_file),
+                self.scopes
+            )
+            print(f"\nAuthenticating account: {self.account_id}")
+            print("Please follow the browser instructions to authorize access.\n")
+            self._creds = flow.run_local_server(port=0)
 
             # Save credentials for future use
             self._save_credentials()
 
         return self._creds
 
+    @staticmethod
+    def _expires_soon(creds: Credentials) -> bool:
+        """Check if credentials expire within the proactive refresh margin."""
+        if creds.expiry is None:
+            return False
+        # google-auth stores expiry as a naive UTC datetime
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return creds.expiry - now < REFRESH_MARGIN
+
     def _save_credentials(self) -> None:
-        """Save credentials to token file."""
+        """Save credentials to token file (atomically, skipping unchanged tokens)."""
         if self._creds:
             self._ensure_tokens_dir()
-            with open(self.token_file, 'w') as token:
-                token.write(self._creds.to_json())
+            data = self._creds.to_json().encode('utf-8')
+
+            try:
+                if self.token_file.read_bytes() == data:
+                    return
+            except FileNotFoundError:
+                pass
+
+            # Write to a temporary file and rename it over the token file so
+            # readers never see a partially written token
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.tokens_dir,
+                prefix=f"{self.token_file.name}.",
+                suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, 'wb') as tmp_file:
+                    tmp_file.write(data)
+                os.replace(tmp_path, self.token_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
 
     def revoke_credentials(self) -> None:
         """Revoke and delete stored credentials for this account."""
@@ -127,13 +182,20 @@ class GmailOAuthHandler:
         """
         tokens_dir = tokens_dir or settings.gmail_tokens_dir
 
-        if not tokens_dir.exists():
+        # Single directory pass; DirEntry.is_file() reuses the type info from scandir
+        try:
+            with os.scandir(tokens_dir) as entries:
+                token_names = [
+                    entry.name for entry in entries
+                    if entry.name.startswith("token_")
+                    and entry.name.endswith(".json")
+                    and entry.is_file()
+                ]
+        except FileNotFoundError:
             return []
 
-        accounts = []
-        for token_file in tokens_dir.glob("token_*.json"):
-            # Extract account ID from filename
-            account_id = token_file.stem.replace('token_', '').replace('_at_', '@').replace('_', '.')
-            accounts.append(account_id)
-
-        return accounts
+        # Extract account ID from filename
+        return [
+            name.removeprefix("token_").removesuffix(".json").replace('_at_', '@').replace('_', '.')
+            for name in token_names
+        ]
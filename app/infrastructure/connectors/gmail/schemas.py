@@ -3,11 +3,11 @@ Gmail API response schemas and mappers.
 Maps Gmail API responses to domain entities.
 """
 import base64
-from datetime import datetime
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email import encoders
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Any, Optional
 from app.domain.entities.email import (
     Email,
@@ -17,6 +17,54 @@ from app.domain.entities.email import (
     EmailLabel
 )
 
+# Gmail system labels recur on every message; map them to one shared string each
+_SYSTEM_LABELS = {
+    label: sys.intern(label)
+    for label in (
+        *(label.value for label in EmailLabel),
+        "CATEGORY_PERSONAL",
+        "CATEGORY_SOCIAL",
+        "CATEGORY_UPDATES",
+        "CATEGORY_PROMOTIONS",
+        "CATEGORY_FORUMS",
+    )
+}
+
+# Canonical RFC 2822 date as Gmail writes it: 'Mon, 20 Jan 2025 10:30:00 -0800'
+_RFC2822_DATE_RE = re.compile(
+    r'(?:[A-Z][a-z]{2}, )?(\d{1,2}) ([A-Z][a-z]{2}) (\d{4}) '
+    r'(\d{2}):(\d{2}):(\d{2}) ([+-])(\d{2})(\d{2})'
+)
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+         'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'),
+        start=1
+    )
+}
+
+# 'Display Name <email@example.com>': everything before '<' is the name
+_NAMED_ADDRESS_RE = re.compile(r'([^<]*)<([^>]*)>')
+
+# Header values that MIMEText writes verbatim: printable ASCII on one line
+_VERBATIM_HEADER_RE = re.compile(r'[\x20-\x7e]*')
+
+# Line endings the email generator normalizes to '\n' in 7bit bodies
+_LINE_BREAK_RE = re.compile(r'\r\n|\r')
+
+# MIME headers written by MIMEText(body, 'plain') for each body charset
+_PLAIN_ASCII_PREAMBLE = (
+    b'Content-Type: text/plain; charset="us-ascii"\n'
+    b'MIME-Version: 1.0\n'
+    b'Content-Transfer-Encoding: 7bit\n'
+)
+_PLAIN_UTF8_PREAMBLE = (
+    b'Content-Type: text/plain; charset="utf-8"\n'
+    b'MIME-Version: 1.0\n'
+    b'Content-Transfer-Encoding: base64\n'
+)
+
 
 class GmailMessageMapper:
     """Maps Gmail API message format to domain Email entity."""
@@ -32,10 +80,8 @@ class GmailMessageMapper:
         Returns:
             Email entity
         """
-        headers = {
-            h['name'].lower(): h['value']
-            for h in gmail_message.get('payload', {}).get('headers', [])
-        }
+        payload = gmail_message.get('payload', {})
+        headers = {h['name'].lower(): h['value'] for h in payload.get('headers', [])}
 
         # Parse addresses
         from_addr = GmailMessageMapper._parse_email_address(
@@ -48,27 +94,23 @@ class GmailMessageMapper:
             headers.get('cc', '')
         )
 
-        # Get body
-        body_text, body_html = GmailMessageMapper._extract_body(
-            gmail_message.get('payload', {})
-        )
+        # Get body and attachments
+        body_text, body_html, attachments = GmailMessageMapper._walk_payload(payload)
 
         # Parse date
         date_str = headers.get('date')
         date = GmailMessageMapper._parse_date(date_str) if date_str else None
 
         # Get labels
-        labels = gmail_message.get('labelIds', [])
+        labels = [
+            _SYSTEM_LABELS.get(label, label)
+            for label in gmail_message.get('labelIds', [])
+        ]
 
         # Check read status
         is_read = EmailLabel.UNREAD.value not in labels
         is_starred = EmailLabel.STARRED.value in labels
 
-        # Get attachments
-        attachments = GmailMessageMapper._extract_attachments(
-            gmail_message.get('payload', {})
-        )
-
         return Email(
             id=gmail_message['id'],
             thread_id=gmail_message.get('threadId', ''),
@@ -92,10 +134,10 @@ class GmailMessageMapper:
         if not address_str:
             return EmailAddress(email="unknown@unknown.com")
 
-        if '<' in address_str and '>' in address_str:
-            name = address_str.split('<')[0].strip().strip('"')
-            email = address_str.split('<')[1].split('>')[0].strip()
-            return EmailAddress(email=email, name=name if name else None)
+        match = _NAMED_ADDRESS_RE.match(address_str)
+        if match:
+            name = match.group(1).strip().strip('"')
+            return EmailAddress(email=match.group(2).strip(), name=name or None)
 
         return EmailAddress(email=address_str.strip())
 
@@ -116,72 +158,111 @@ class GmailMessageMapper:
     @staticmethod
     def _extract_body(payload: dict[str, Any]) -> tuple[Optional[str], Optional[str]]:
         """Extract text and HTML body from message payload."""
-        body_text = None
-        body_html = None
-
-        def decode_body(data: str) -> str:
-            """Decode base64url encoded body data."""
-            return base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
-
-        # Check if simple text/html message
-        if 'body' in payload and payload['body'].get('data'):
-            mime_type = payload.get('mimeType', '')
-            data = decode_body(payload['body']['data'])
-
-            if 'text/plain' in mime_type:
-                body_text = data
-            elif 'text/html' in mime_type:
-                body_html = data
-
-        # Check multipart message
-        if 'parts' in payload:
-            for part in payload['parts']:
-                mime_type = part.get('mimeType', '')
-
-                if mime_type == 'text/plain' and part.get('body', {}).get('data'):
-                    body_text = decode_body(part['body']['data'])
-                elif mime_type == 'text/html' and part.get('body', {}).get('data'):
-                    body_html = decode_body(part['body']['data'])
-                elif 'parts' in part:
-                    # Recursive for nested parts
-                    text, html = GmailMessageMapper._extract_body(part)
-                    body_text = body_text or text
-                    body_html = body_html or html
-
+        body_text, body_html, _ = GmailMessageMapper._walk_payload(payload)
         return body_text, body_html
 
     @staticmethod
     def _extract_attachments(payload: dict[str, Any]) -> list[EmailAttachment]:
         """Extract attachment metadata from message payload."""
-        attachments = []
+        if not payload.get('parts'):
+            # Attachments are always sub-parts; a single-part message has none
+            return []
+        return GmailMessageMapper._walk_payload(payload)[2]
 
-        def process_part(part: dict[str, Any]) -> None:
-            """Process a message part for attachments."""
-            if part.get('filename'):
-                attachment = EmailAttachment(
-                    filename=part['filename'],
-                    mime_type=part.get('mimeType', 'application/octet-stream'),
-                    size=part.get('body', {}).get('size', 0),
-                    attachment_id=part.get('body', {}).get('attachmentId')
-                )
-                attachments.append(attachment)
+    @staticmethod
+    def _walk_payload(
+        payload: dict[str, Any]
+    ) -> tuple[Optional[str], Optional[str], list[EmailAttachment]]:
+        """Extract text body, HTML body and attachments in a single pass over the MIME tree."""
+        if not payload.get('parts'):
+            # Single-part message: the body is the payload itself, with no attachments
+            data = payload.get('body', {}).get('data')
+            mime_type = payload.get('mimeType', '')
+            if data and 'text/plain' in mime_type:
+                return GmailMessageMapper._decode_body(data), None, []
+            if data and 'text/html' in mime_type:
+                return None, GmailMessageMapper._decode_body(data), []
+            return None, None, []
+
+        attachments = []
 
-            # Check nested parts
-            if 'parts' in part:
-                for sub_part in part['parts']:
-                    process_part(sub_part)
+        def walk(part: dict[str, Any], collect_body: bool) -> tuple[Optional[str], Optional[str]]:
+            """Collect attachments below a part and, if requested, its raw text and HTML body data."""
+            text_data = None
+            html_data = None
 
-        if 'parts' in payload:
-            for part in payload['parts']:
-                process_part(part)
+            # Check if simple text/html message
+            data = part.get('body', {}).get('data') if collect_body else None
+            if data:
+                mime_type = part.get('mimeType', '')
+                if 'text/plain' in mime_type:
+                    text_data = data
+                elif 'text/html' in mime_type:
+                    html_data = data
+
+            # Check multipart message
+            for sub_part in part.get('parts', []):
+                if sub_part.get('filename'):
+                    attachments.append(EmailAttachment(
+                        filename=sub_part['filename'],
+                        mime_type=sub_part.get('mimeType', 'application/octet-stream'),
+                        size=sub_part.get('body', {}).get('size', 0),
+                        attachment_id=sub_part.get('body', {}).get('attachmentId')
+                    ))
+
+                mime_type = sub_part.get('mimeType', '')
+                data = sub_part.get('body', {}).get('data') if collect_body else None
+
+                if data and mime_type in ('text/plain', 'text/html'):
+                    if mime_type == 'text/plain':
+                        text_data = data
+                    else:
+                        html_data = data
+                    if 'parts' in sub_part:
+                        # Body already taken from this part; only collect attachments
+                        walk(sub_part, collect_body=False)
+                elif 'parts' in sub_part:
+                    # Recursive for nested parts
+                    text, html = walk(sub_part, collect_body)
+                    text_data = text_data or text
+                    html_data = html_data or html
+
+            return text_data, html_data
+
+        # Only the winning text and HTML parts are decoded; attachment
+        # bodies are never decoded here (they are fetched by attachment_id)
+        text_data, html_data = walk(payload, collect_body=True)
+        return (
+            GmailMessageMapper._decode_body(text_data) if text_data else None,
+            GmailMessageMapper._decode_body(html_data) if html_data else None,
+            attachments
+        )
 
-        return attachments
+    @staticmethod
+    def _decode_body(data: str) -> str:
+        """Decode base64url encoded body data."""
+        return base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _parse_date(date_str: str) -> Optional[datetime]:
-        """Parse date string to datetime."""
+        """Parse date string to datetime (cached; Date headers repeat across a listing)."""
+        match = _RFC2822_DATE_RE.fullmatch(date_str)
+        # '-0000' means "no zone information" and parses to a naive datetime
+        if match and match.group(7, 8, 9) != ('-', '00', '00') and match.group(2) in _MONTHS:
+            day, month, year, hour, minute, second, sign, tz_hours, tz_minutes = match.groups()
+            offset = timedelta(hours=int(tz_hours), minutes=int(tz_minutes))
+            try:
+                return datetime(
+                    int(year), _MONTHS[month], int(day),
+                    int(hour), int(minute), int(second),
+                    tzinfo=timezone(-offset if sign == '-' else offset)
+                )
+            except ValueError:
+                pass
+
+        # Anything else goes through the general RFC 2822 parser
         try:
-            from email.utils import parsedate_to_datetime
             return parsedate_to_datetime(date_str)
         except Exception:
             return None
@@ -197,6 +278,30 @@ class GmailMessageMapper:
         Returns:
             Base64 encoded message string
         """
+        headers = [
+            ('To', ', '.join(str(addr) for addr in draft.to)),
+            ('Subject', draft.subject)
+        ]
+        if draft.cc:
+            headers.append(('Cc', ', '.join(str(addr) for addr in draft.cc)))
+        if draft.reply_to_message_id:
+            headers.append(('In-Reply-To', draft.reply_to_message_id))
+            headers.append(('References', draft.reply_to_message_id))
+
+        # Text-only drafts skip the email.mime object tree
+        if not draft.body_html and not draft.attachments:
+            raw_bytes = GmailMessageMapper._build_plain_message(
+                headers, draft.body_text or ''
+            )
+            if raw_bytes is not None:
+                return base64.urlsafe_b64encode(raw_bytes).decode('utf-8')
+
+        # The email.mime classes are only imported for drafts the fast path can't handle
+        from email import encoders
+        from email.mime.base import MIMEBase
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.text import MIMEText
+
         # Create MIME message
         if draft.body_html:
             message = MIMEMultipart('alternative')
@@ -207,15 +312,8 @@ class GmailMessageMapper:
             message = MIMEText(draft.body_text or '', 'plain')
 
         # Set headers
-        message['To'] = ', '.join(str(addr) for addr in draft.to)
-        message['Subject'] = draft.subject
-
-        if draft.cc:
-            message['Cc'] = ', '.join(str(addr) for addr in draft.cc)
-
-        if draft.reply_to_message_id:
-            message['In-Reply-To'] = draft.reply_to_message_id
-            message['References'] = draft.reply_to_message_id
+        for name, value in headers:
+            message[name] = value
 
         # Add attachments
         if draft.attachments:
@@ -241,3 +339,26 @@ class GmailMessageMapper:
         ).decode('utf-8')
 
         return raw_message
+
+    @staticmethod
+    def _build_plain_message(headers: list[tuple[str, str]], body: str) -> Optional[bytes]:
+        """
+        Serialize a text-only message without building email.mime objects.
+
+        Produces the same bytes as MIMEText(body, 'plain').as_bytes(). Returns
+        None when a header would need RFC 2047 encoding or folding, so the
+        caller falls back to the email package.
+        """
+        for name, value in headers:
+            if len(name) + 2 + len(value) > 78 or not _VERBATIM_HEADER_RE.fullmatch(value):
+                return None
+
+        if body.isascii():
+            preamble = _PLAIN_ASCII_PREAMBLE
+            payload = _LINE_BREAK_RE.sub('\n', body).encode('ascii')
+        else:
+            preamble = _PLAIN_UTF8_PREAMBLE
+            payload = base64.encodebytes(body.encode('utf-8'))
+
+        header_block = ''.join(f'{name}: {value}\n' for name, value in headers)
+        return preamble + header_block.encode('ascii') + b'\n' + payload
@@ -2,6 +2,8 @@
 Google Calendar API client implementation.
 Handles all interactions with Google Calendar API.
 """
+import asyncio
+import threading
 from typing import Optional
 from datetime import datetime
 from googleapiclient.discovery import build
@@ -16,11 +18,26 @@ from app.domain.entities.calendar_event import (
     EventSearchCriteria
 )
 
+# Largest page the Calendar API returns for events().list()
+MAX_EVENTS_PAGE_SIZE = 2500
+
+# Partial response: only the event fields GoogleCalendarMapper reads
+EVENT_LIST_FIELDS = (
+    'nextPageToken,'
+    'items(id,summary,description,location,start,end,attendees,reminders,'
+    'recurrence,created,updated,creator/email,organizer/email,status,htmlLink)'
+)
+
 
 class GoogleCalendarClient:
     """
     Google Calendar API client for calendar operations.
     Handles authentication and API communication for a specific account.
+
+    googleapiclient requests are blocking, so each execute() runs in a worker
+    thread to keep the event loop free while waiting on the network. The cached
+    service shares one httplib2 transport, which is not thread-safe, so those
+    calls are serialized with a lock.
     """
 
     def __init__(
@@ -38,14 +55,28 @@ class GoogleCalendarClient:
         self.account_id = account_id
         self.oauth_handler = oauth_handler or GoogleCalendarOAuthHandler(account_id=account_id)
         self._service = None
+        self._http_lock = threading.Lock()
 
     def _get_service(self):
         """Get or create Google Calendar API service."""
         if self._service is None:
             creds = self.oauth_handler.get_credentials()
-            self._service = build('calendar', 'v3', credentials=creds)
+            # Use the discovery document bundled with the library and skip the
+            # discovery cache lookup; the built service is reused afterwards
+            self._service = build(
+                'calendar',
+                'v3',
+                credentials=creds,
+                cache_discovery=False,
+                static_discovery=True
+            )
         return self._service
 
+    def _execute(self, request) -> dict:
+        """Execute a request on the shared transport, one call at a time."""
+        with self._http_lock:
+            return request.execute()
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10)
@@ -74,11 +105,12 @@ class GoogleCalendarClient:
             service = self._get_service()
             event_data = GoogleCalendarMapper.from_event_draft(draft)
 
-            event = service.events().insert(
+            request = service.events().insert(
                 calendarId=calendar_id,
                 body=event_data,
                 sendUpdates='all'  # Send invitations to attendees
-            ).execute()
+            )
+            event = await asyncio.to_thread(self._execute, request)
 
             return event['id']
 
@@ -112,10 +144,11 @@ class GoogleCalendarClient:
 
             service = self._get_service()
 
-            event = service.events().get(
+            request = service.events().get(
                 calendarId=calendar_id,
                 eventId=event_id
-            ).execute()
+            )
+            event = await asyncio.to_thread(self._execute, request)
 
             return GoogleCalendarMapper.to_event_entity(event)
 
@@ -149,12 +182,13 @@ class GoogleCalendarClient:
             service = self._get_service()
             event_data = GoogleCalendarMapper.from_event_draft(draft)
 
-            service.events().update(
+            request = service.events().update(
                 calendarId=calendar_id,
                 eventId=event_id,
                 body=event_data,
                 sendUpdates='all'
-            ).execute()
+            )
+            await asyncio.to_thread(self._execute, request)
 
         except HttpError as error:
             raise Exception(f"Failed to update event: {error}")
@@ -181,11 +215,12 @@ class GoogleCalendarClient:
         try:
             service = self._get_service()
 
-            service.events().delete(
+            request = service.events().delete(
                 calendarId=calendar_id,
                 eventId=event_id,
                 sendUpdates='all'
-            ).execute()
+            )
+            await asyncio.to_thread(self._execute, request)
 
         except HttpError as error:
             raise Exception(f"Failed to delete event: {error}")
@@ -217,9 +252,9 @@ class GoogleCalendarClient:
 
             params = {
                 'calendarId': criteria.calendar_id,
-                'maxResults': criteria.max_results,
                 'singleEvents': criteria.single_events,
-                'orderBy': criteria.order_by
+                'orderBy': criteria.order_by,
+                'fields': EVENT_LIST_FIELDS
             }
 
             if criteria.time_min:
@@ -229,8 +264,21 @@ class GoogleCalendarClient:
             if criteria.query:
                 params['q'] = criteria.query
 
-            events_result = service.events().list(**params).execute()
-            events = events_result.get('items', [])
+            # Page tokens come from the previous response, so pages are fetched in order
+            events = []
+            while True:
+                params['maxResults'] = min(
+                    criteria.max_results - len(events),
+                    MAX_EVENTS_PAGE_SIZE
+                )
+                request = service.events().list(**params)
+                events_result = await asyncio.to_thread(self._execute, request)
+                events.extend(events_result.get('items', []))
+
+                page_token = events_result.get('nextPageToken')
+                if not page_token or len(events) >= criteria.max_results:
+                    break
+                params['pageToken'] = page_token
 
             return [GoogleCalendarMapper.to_event_entity(e) for e in events]
 
@@ -256,7 +304,8 @@ class GoogleCalendarClient:
 
             service = self._get_service()
 
-            calendars_result = service.calendarList().list().execute()
+            request = service.calendarList().list()
+            calendars_result = await asyncio.to_thread(self._execute, request)
             calendars = calendars_result.get('items', [])
 
             return [GoogleCalendarMapper.to_calendar_entity(c) for c in calendars]
@@ -297,7 +346,8 @@ class GoogleCalendarClient:
                 'items': [{'id': cal_id} for cal_id in calendar_ids]
             }
 
-            return service.freebusy().query(body=body).execute()
+            request = service.freebusy().query(body=body)
+            return await asyncio.to_thread(self._execute, request)
 
         except HttpError as error:
             raise Exception(f"Failed to get free/busy: {error}")
@@ -7,7 +7,6 @@ from pathlib import Path
 from typing import Optional
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
 from app.config.settings import settings
 
 
@@ -78,6 +77,10 @@ class GoogleCalendarOAuthHandler:
                         "Please download it from Google Cloud Console."
                     )
 
+                # Only needed for first-time authorization; importing
+                # google_auth_oauthlib pulls in requests_oauthlib and oauthlib
+                from google_auth_oauthlib.flow import InstalledAppFlow
+
                 flow = InstalledAppFlow.from_client_secrets_file(
                     str(self.credentials_file),
                     self.scopes
@@ -0,0 +1,18 @@
+"""
+Assertion helpers shared by the mapper tests.
+"""
+from operator import attrgetter
+
+
+def assert_attrs(entity, expected):
+    """
+    Assert entity attributes match ``expected``, a name -> value dict.
+
+    All attributes are fetched with one attrgetter call; dotted names reach
+    nested entities. Comparing dicts keeps pytest's diff keyed by attribute
+    name, so a failure shows which fields differ.
+    """
+    values = attrgetter(*expected)(entity)
+    if len(expected) == 1:
+        values = (values,)
+    assert dict(zip(expected, values)) == expected
@@ -0,0 +1,25 @@
+"""
+Lightweight async stubs for use case tests.
+Cheaper than AsyncMock when a test only needs a canned return value
+and the list of calls that were made.
+"""
+
+
+def async_returning(value):
+    """
+    Build an async callable that records its calls and returns ``value``.
+
+    Calls are stored as ``(args, kwargs)`` tuples in ``stub.calls``.
+    ``stub.return_value`` can be reassigned after creation, and setting
+    ``stub.side_effect`` to an exception makes the stub raise it.
+    """
+    async def stub(*args, **kwargs):
+        stub.calls.append((args, kwargs))
+        if stub.side_effect is not None:
+            raise stub.side_effect
+        return stub.return_value
+
+    stub.calls = []
+    stub.return_value = value
+    stub.side_effect = None
+    return stub
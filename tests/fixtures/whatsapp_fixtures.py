@@ -5,6 +5,13 @@ Contains sample data for testing WhatsApp API responses and webhook payloads.
 from datetime import datetime
 
 
+# ============ Shared Test Constants ============
+
+SAMPLE_PHONE_NUMBER = "+14155552671"
+SAMPLE_IMAGE_URL = "https://example.com/image.jpg"
+SAMPLE_PREVIEW_TEXT = "Check this out: https://example.com"
+
+
 # ============ WhatsApp API Response Fixtures ============
 
 SAMPLE_SEND_MESSAGE_RESPONSE = {
@@ -217,7 +224,7 @@ SAMPLE_WEBHOOK_STATUS_UPDATE = {
 # ============ Domain Entity Fixtures ============
 
 def create_sample_message_draft(
-    to: str = "+14155552671",
+    to: str = SAMPLE_PHONE_NUMBER,
     message_type: str = "text",
     text_content: str = "Test message"
 ):
@@ -0,0 +1,57 @@
+"""
+Shared fixtures for Notion use case tests.
+"""
+import pytest
+
+from app.domain.entities.notion_block import NotionBlock
+from app.domain.entities.notion_database import NotionDatabaseEntry
+from app.domain.entities.notion_page import NotionPage
+
+
+@pytest.fixture(scope="session")
+def mock_blocks():
+    """Create mock content blocks (read-only, shared across the session)."""
+    return [
+        NotionBlock(
+            id="block1",
+            type="paragraph",
+            content={"text": [{"text": {"content": "First paragraph"}}]}
+        ),
+        NotionBlock(
+            id="block2",
+            type="heading_1",
+            content={"text": [{"text": {"content": "Main Title"}}]}
+        )
+    ]
+
+
+@pytest.fixture(scope="session")
+def mock_entries():
+    """Create mock database entries (read-only, shared across the session)."""
+    return [
+        NotionDatabaseEntry(
+            id="entry1",
+            properties={"Name": {"title": [{"text": {"content": "Entry 1"}}]}}
+        ),
+        NotionDatabaseEntry(
+            id="entry2",
+            properties={"Name": {"title": [{"text": {"content": "Entry 2"}}]}}
+        )
+    ]
+
+
+@pytest.fixture(scope="session")
+def mock_pages():
+    """Create mock pages (read-only, shared across the session)."""
+    return [
+        NotionPage(
+            id="page1",
+            title="First Page",
+            created_time="2025-01-01T00:00:00Z"
+        ),
+        NotionPage(
+            id="page2",
+            title="Second Page",
+            created_time="2025-01-02T00:00:00Z"
+        )
+    ]
@@ -2,12 +2,13 @@
 Unit tests for AppendBlocks use case.
 """
 import pytest
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock
 from app.application.use_cases.notion.append_blocks import (
     AppendBlocksUseCase,
     AppendBlocksRequest,
     AppendBlocksResponse
 )
+from tests.fixtures.async_stubs import async_returning
 
 
 class TestAppendBlocksUseCase:
@@ -17,7 +18,7 @@ class TestAppendBlocksUseCase:
     def mock_client(self):
         """Create mock Notion client."""
         client = MagicMock()
-        client.append_blocks = AsyncMock(return_value=["block1", "block2"])
+        client.append_blocks = async_returning(["block1", "block2"])
         return client
 
     @pytest.fixture
@@ -42,12 +43,12 @@ class TestAppendBlocksUseCase:
         assert response.count == 2
         assert len(response.block_ids) == 2
         assert response.error is None
-        mock_client.append_blocks.assert_called_once()
+        assert len(mock_client.append_blocks.calls) == 1
 
     @pytest.mark.asyncio
     async def test_append_single_block(self, use_case, mock_client):
         """Test appending a single block."""
-        mock_client.append_blocks = AsyncMock(return_value=["block1"])
+        mock_client.append_blocks = async_returning(["block1"])
 
         request = AppendBlocksRequest(
             page_id="page123",
@@ -79,7 +80,7 @@ class TestAppendBlocksUseCase:
 
         assert response.success is True
 
-        blocks = mock_client.append_blocks.call_args[1]["blocks"]
+        blocks = mock_client.append_blocks.calls[0][1]["blocks"]
         assert len(blocks) == 1
         assert blocks[0].children is not None
 
@@ -95,7 +96,7 @@ class TestAppendBlocksUseCase:
 
         assert response.success is True
 
-        blocks = mock_client.append_blocks.call_args[1]["blocks"]
+        blocks = mock_client.append_blocks.calls[0][1]["blocks"]
         assert blocks[0].type == "paragraph"
 
     @pytest.mark.asyncio
@@ -2,12 +2,13 @@
 Unit tests for CreateDatabaseEntry use case.
 """
 import pytest
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock
 from app.application.use_cases.notion.create_database_entry import (
     CreateDatabaseEntryUseCase,
     CreateDatabaseEntryRequest,
     CreateDatabaseEntryResponse
 )
+from tests.fixtures.async_stubs import async_returning
 
 
 class TestCreateDatabaseEntryUseCase:
@@ -17,7 +18,7 @@ class TestCreateDatabaseEntryUseCase:
     def mock_client(self):
         """Create mock Notion client."""
         client = MagicMock()
-        client.create_database_entry = AsyncMock(return_value="entry123")
+        client.create_database_entry = async_returning("entry123")
         return client
 
     @pytest.fixture
@@ -41,7 +42,7 @@ class TestCreateDatabaseEntryUseCase:
         assert response.success is True
         assert response.entry_id == "entry123"
         assert response.error is None
-        mock_client.create_database_entry.assert_called_once()
+        assert len(mock_client.create_database_entry.calls) == 1
 
     @pytest.mark.asyncio
     async def test_create_database_entry_with_multiple_properties(self, use_case, mock_client):
@@ -61,7 +62,7 @@ class TestCreateDatabaseEntryUseCase:
 
         assert response.success is True
 
-        draft = mock_client.create_database_entry.call_args[0][0]
+        draft = mock_client.create_database_entry.calls[0][0][0]
         assert draft.database_id == "db123"
         assert "Name" in draft.properties
         assert "Tags" in draft.properties
@@ -81,7 +82,7 @@ class TestCreateDatabaseEntryUseCase:
 
         assert response.success is True
 
-        draft = mock_client.create_database_entry.call_args[0][0]
+        draft = mock_client.create_database_entry.calls[0][0][0]
         assert draft.children is not None
         assert len(draft.children) == 1
 
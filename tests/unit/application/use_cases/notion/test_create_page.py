@@ -2,12 +2,13 @@
 Unit tests for CreatePage use case.
 """
 import pytest
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock
 from app.application.use_cases.notion.create_page import (
     CreatePageUseCase,
     CreatePageRequest,
     CreatePageResponse
 )
+from tests.fixtures.async_stubs import async_returning
 
 
 class TestCreatePageUseCase:
@@ -17,7 +18,7 @@ class TestCreatePageUseCase:
     def mock_client(self):
         """Create mock Notion client."""
         client = MagicMock()
-        client.create_page = AsyncMock(return_value="page123")
+        client.create_page = async_returning("page123")
         return client
 
     @pytest.fixture
@@ -38,7 +39,7 @@ class TestCreatePageUseCase:
         assert response.success is True
         assert response.page_id == "page123"
         assert response.error is None
-        mock_client.create_page.assert_called_once()
+        assert len(mock_client.create_page.calls) == 1
 
     @pytest.mark.asyncio
     async def test_create_page_with_properties(self, use_case, mock_client):
@@ -57,7 +58,7 @@ class TestCreatePageUseCase:
 
         assert response.success is True
 
-        draft = mock_client.create_page.call_args[0][0]
+        draft = mock_client.create_page.calls[0][0][0]
         assert draft.title == "Project Page"
         assert draft.parent_type == "database_id"
         assert draft.properties is not None
@@ -78,7 +79,7 @@ class TestCreatePageUseCase:
 
         assert response.success is True
 
-        draft = mock_client.create_page.call_args[0][0]
+        draft = mock_client.create_page.calls[0][0][0]
         assert len(draft.children) == 2
 
     @pytest.mark.asyncio
@@ -95,7 +96,7 @@ class TestCreatePageUseCase:
 
         assert response.success is True
 
-        draft = mock_client.create_page.call_args[0][0]
+        draft = mock_client.create_page.calls[0][0][0]
         assert draft.icon is not None
         assert draft.cover is not None
 
@@ -2,13 +2,14 @@
 Unit tests for GetPage use case.
 """
 import pytest
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock
 from app.application.use_cases.notion.get_page import (
     GetPageUseCase,
     GetPageRequest,
     GetPageResponse
 )
 from app.domain.entities.notion_page import NotionPage
+from tests.fixtures.async_stubs import async_returning
 
 
 class TestGetPageUseCase:
@@ -28,7 +29,7 @@ class TestGetPageUseCase:
     def mock_client(self, mock_page):
         """Create mock Notion client."""
         client = MagicMock()
-        client.get_page = AsyncMock(return_value=mock_page)
+        client.get_page = async_returning(mock_page)
         return client
 
     @pytest.fixture
@@ -46,7 +47,7 @@ class TestGetPageUseCase:
         assert response.success is True
         assert response.page == mock_page
         assert response.error is None
-        mock_client.get_page.assert_called_once_with("page123")
+        assert mock_client.get_page.calls == [(("page123",), {})]
 
     @pytest.mark.asyncio
     async def test_get_page_not_found(self, use_case, mock_client):
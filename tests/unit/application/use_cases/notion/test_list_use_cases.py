@@ -0,0 +1,96 @@
+"""
+Shared unit tests for the Notion use cases that return a list of entities.
+
+GetPageContent, QueryDatabase and SearchPages follow the same contract:
+call one client method, wrap the result list in the response and report
+its count, or return success=False with the error message. Use case
+specific behaviour (filters, sorting, pagination) is tested in the
+per-use-case modules.
+"""
+import pytest
+from unittest.mock import MagicMock
+from app.application.use_cases.notion.get_page_content import (
+    GetPageContentUseCase,
+    GetPageContentRequest
+)
+from app.application.use_cases.notion.query_database import (
+    QueryDatabaseUseCase,
+    QueryDatabaseRequest
+)
+from app.application.use_cases.notion.search_pages import (
+    SearchPagesUseCase,
+    SearchPagesRequest
+)
+from tests.fixtures.async_stubs import async_returning
+
+# (use case, request, client method, data fixture, response list attribute)
+LIST_USE_CASES = [
+    pytest.param(
+        GetPageContentUseCase, GetPageContentRequest(page_id="page123"),
+        "get_block_children", "mock_blocks", "blocks",
+        id="get_page_content"
+    ),
+    pytest.param(
+        QueryDatabaseUseCase, QueryDatabaseRequest(database_id="db123"),
+        "query_database", "mock_entries", "entries",
+        id="query_database"
+    ),
+    pytest.param(
+        SearchPagesUseCase, SearchPagesRequest(query="test"),
+        "search", "mock_pages", "pages",
+        id="search_pages"
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "use_case_cls,request_obj,client_method,data_fixture,items_attr",
+    LIST_USE_CASES
+)
+class TestListUseCases:
+    """Test suite for list-returning Notion use cases."""
+
+    @pytest.mark.asyncio
+    async def test_success(
+        self, request, use_case_cls, request_obj, client_method, data_fixture, items_attr
+    ):
+        """Test the client result is returned with its count."""
+        data = request.getfixturevalue(data_fixture)
+        stub = async_returning(data)
+        client = MagicMock(**{client_method: stub})
+
+        response = await use_case_cls(client=client).execute(request_obj)
+
+        assert response.success is True
+        assert response.count == len(data)
+        assert getattr(response, items_attr) == data
+        assert response.error is None
+        assert len(stub.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_results(
+        self, use_case_cls, request_obj, client_method, data_fixture, items_attr
+    ):
+        """Test an empty client result."""
+        client = MagicMock(**{client_method: async_returning([])})
+
+        response = await use_case_cls(client=client).execute(request_obj)
+
+        assert response.success is True
+        assert response.count == 0
+        assert len(getattr(response, items_attr)) == 0
+
+    @pytest.mark.asyncio
+    async def test_failure(
+        self, use_case_cls, request_obj, client_method, data_fixture, items_attr
+    ):
+        """Test client errors are reported in the response."""
+        stub = async_returning([])
+        stub.side_effect = Exception("API error")
+        client = MagicMock(**{client_method: stub})
+
+        response = await use_case_cls(client=client).execute(request_obj)
+
+        assert response.success is False
+        assert response.count == 0
+        assert "API error" in response.error
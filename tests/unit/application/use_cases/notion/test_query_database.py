@@ -2,37 +2,23 @@
 Unit tests for QueryDatabase use case.
 """
 import pytest
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock
 from app.application.use_cases.notion.query_database import (
     QueryDatabaseUseCase,
     QueryDatabaseRequest,
     QueryDatabaseResponse
 )
-from app.domain.entities.notion_database import NotionDatabaseEntry
+from tests.fixtures.async_stubs import async_returning
 
 
 class TestQueryDatabaseUseCase:
     """Test suite for QueryDatabase use case."""
 
-    @pytest.fixture
-    def mock_entries(self):
-        """Create mock database entries."""
-        return [
-            NotionDatabaseEntry(
-                id="entry1",
-                properties={"Name": {"title": [{"text": {"content": "Entry 1"}}]}}
-            ),
-            NotionDatabaseEntry(
-                id="entry2",
-                properties={"Name": {"title": [{"text": {"content": "Entry 2"}}]}}
-            )
-        ]
-
     @pytest.fixture
     def mock_client(self, mock_entries):
         """Create mock Notion client."""
         client = MagicMock()
-        client.query_database = AsyncMock(return_value=mock_entries)
+        client.query_database = async_returning(mock_entries)
         return client
 
     @pytest.fixture
@@ -40,19 +26,6 @@ class TestQueryDatabaseUseCase:
         """Create use case instance."""
         return QueryDatabaseUseCase(client=mock_client)
 
-    @pytest.mark.asyncio
-    async def test_query_database_success(self, use_case, mock_client, mock_entries):
-        """Test successful database query."""
-        request = QueryDatabaseRequest(database_id="db123")
-
-        response = await use_case.execute(request)
-
-        assert response.success is True
-        assert response.count == 2
-        assert len(response.entries) == 2
-        assert response.error is None
-        mock_client.query_database.assert_called_once()
-
     @pytest.mark.asyncio
     async def test_query_database_with_filter(self, use_case, mock_client):
         """Test querying database with filter."""
@@ -66,7 +39,7 @@ class TestQueryDatabaseUseCase:
 
         await use_case.execute(request)
 
-        query = mock_client.query_database.call_args[0][0]
+        query = mock_client.query_database.calls[0][0][0]
         assert query.database_id == "db123"
         assert query.filter is not None
 
@@ -82,7 +55,7 @@ class TestQueryDatabaseUseCase:
 
         await use_case.execute(request)
 
-        query = mock_client.query_database.call_args[0][0]
+        query = mock_client.query_database.calls[0][0][0]
         assert query.sorts is not None
         assert len(query.sorts) == 1
 
@@ -97,32 +70,6 @@ class TestQueryDatabaseUseCase:
 
         await use_case.execute(request)
 
-        query = mock_client.query_database.call_args[0][0]
+        query = mock_client.query_database.calls[0][0][0]
         assert query.start_cursor == "cursor123"
         assert query.page_size == 50
-
-    @pytest.mark.asyncio
-    async def test_query_database_empty_results(self, use_case, mock_client):
-        """Test query with no results."""
-        mock_client.query_database = AsyncMock(return_value=[])
-
-        request = QueryDatabaseRequest(database_id="db123")
-
-        response = await use_case.execute(request)
-
-        assert response.success is True
-        assert response.count == 0
-        assert len(response.entries) == 0
-
-    @pytest.mark.asyncio
-    async def test_query_database_failure(self, use_case, mock_client):
-        """Test database query failure."""
-        mock_client.query_database.side_effect = Exception("API error")
-
-        request = QueryDatabaseRequest(database_id="db123")
-
-        response = await use_case.execute(request)
-
-        assert response.success is False
-        assert response.count == 0
-        assert "API error" in response.error
@@ -2,12 +2,13 @@
 Unit tests for UpdatePage use case.
 """
 import pytest
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock
 from app.application.use_cases.notion.update_page import (
     UpdatePageUseCase,
     UpdatePageRequest,
     UpdatePageResponse
 )
+from tests.fixtures.async_stubs import async_returning
 
 
 class TestUpdatePageUseCase:
@@ -17,7 +18,7 @@ class TestUpdatePageUseCase:
     def mock_client(self):
         """Create mock Notion client."""
         client = MagicMock()
-        client.update_page = AsyncMock(return_value=True)
+        client.update_page = async_returning(True)
         return client
 
     @pytest.fixture
@@ -40,7 +41,7 @@ class TestUpdatePageUseCase:
 
         assert response.success is True
         assert response.error is None
-        mock_client.update_page.assert_called_once()
+        assert len(mock_client.update_page.calls) == 1
 
     @pytest.mark.asyncio
     async def test_update_page_icon(self, use_case, mock_client):
@@ -54,7 +55,7 @@ class TestUpdatePageUseCase:
 
         assert response.success is True
 
-        call_kwargs = mock_client.update_page.call_args[1]
+        call_kwargs = mock_client.update_page.calls[0][1]
         assert call_kwargs["icon"] is not None
 
     @pytest.mark.asyncio
@@ -69,7 +70,7 @@ class TestUpdatePageUseCase:
 
         assert response.success is True
 
-        call_kwargs = mock_client.update_page.call_args[1]
+        call_kwargs = mock_client.update_page.calls[0][1]
         assert call_kwargs["cover"] is not None
 
     @pytest.mark.asyncio
@@ -84,7 +85,7 @@ class TestUpdatePageUseCase:
 
         assert response.success is True
 
-        call_kwargs = mock_client.update_page.call_args[1]
+        call_kwargs = mock_client.update_page.calls[0][1]
         assert call_kwargs["archived"] is True
 
     @pytest.mark.asyncio
@@ -101,7 +102,7 @@ class TestUpdatePageUseCase:
 
         assert response.success is True
 
-        call_kwargs = mock_client.update_page.call_args[1]
+        call_kwargs = mock_client.update_page.calls[0][1]
         assert call_kwargs["properties"] is not None
         assert call_kwargs["icon"] is not None
         assert call_kwargs["cover"] is not None
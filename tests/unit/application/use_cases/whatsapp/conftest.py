@@ -0,0 +1,69 @@
+"""
+Shared fixtures for WhatsApp use case tests.
+"""
+import pytest
+from dataclasses import replace
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from app.application.use_cases.whatsapp.send_media_message import SendMediaMessageUseCase
+from app.application.use_cases.whatsapp.send_template_message import SendTemplateMessageUseCase
+from app.application.use_cases.whatsapp.send_text_message import (
+    SendTextMessageUseCase,
+    SendTextMessageRequest
+)
+from tests.fixtures.whatsapp_fixtures import SAMPLE_PHONE_NUMBER
+
+
+@pytest.fixture(scope="session")
+def _whatsapp_mock_client_template():
+    """Build the mock WhatsApp client once per session."""
+    return SimpleNamespace(
+        send_text_message=AsyncMock(),
+        send_media_message=AsyncMock(),
+        send_template_message=AsyncMock(),
+        upload_media=AsyncMock()
+    )
+
+
+@pytest.fixture
+def mock_client(_whatsapp_mock_client_template):
+    """Reset the shared mock WhatsApp client to its default responses."""
+    client = _whatsapp_mock_client_template
+    for method in vars(client).values():
+        method.reset_mock(side_effect=True)
+    client.send_text_message.return_value = "wamid.HBgLMTQxNTU1NTI2NzEVAgARGBI5MjQxNjI3NzgwNzAzNTAxNTAA"
+    client.send_media_message.return_value = "wamid.MEDIA123456"
+    client.send_template_message.return_value = "wamid.TEMPLATE123"
+    client.upload_media.return_value = "media_id_123"
+    return client
+
+
+@pytest.fixture(scope="session")
+def _text_use_case(_whatsapp_mock_client_template):
+    """Build the SendTextMessage use case once per session."""
+    return SendTextMessageUseCase(client=_whatsapp_mock_client_template)
+
+
+@pytest.fixture(scope="session")
+def _media_use_case(_whatsapp_mock_client_template):
+    """Build the SendMediaMessage use case once per session."""
+    return SendMediaMessageUseCase(client=_whatsapp_mock_client_template)
+
+
+@pytest.fixture(scope="session")
+def _template_use_case(_whatsapp_mock_client_template):
+    """Build the SendTemplateMessage use case once per session."""
+    return SendTemplateMessageUseCase(client=_whatsapp_mock_client_template)
+
+
+@pytest.fixture(scope="session")
+def _base_text_request():
+    """Build the canonical valid text message request once per session."""
+    return SendTextMessageRequest(to=SAMPLE_PHONE_NUMBER, text="Hello")
+
+
+@pytest.fixture
+def base_text_request(_base_text_request):
+    """Return a copy of the canonical text request; tweak it with dataclasses.replace."""
+    return replace(_base_text_request)
@@ -2,7 +2,9 @@
 Unit tests for ListTemplates use case.
 """
 import pytest
-from unittest.mock import MagicMock, AsyncMock
+import pytest_asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 from app.application.use_cases.whatsapp.list_templates import (
     ListTemplatesUseCase,
@@ -11,6 +13,10 @@ from app.application.use_cases.whatsapp.list_templates import (
 )
 from tests.fixtures.whatsapp_fixtures import SAMPLE_TEMPLATES_RESPONSE
 
+SAMPLE_TEMPLATES = SAMPLE_TEMPLATES_RESPONSE["data"]
+UNAUTHORIZED_ERROR = Exception("API error: Unauthorized")
+TIMEOUT_ERROR = Exception("Connection timeout")
+
 
 class TestListTemplatesUseCase:
     """Test suite for ListTemplates use case."""
@@ -18,16 +24,33 @@ class TestListTemplatesUseCase:
     @pytest.fixture
     def mock_client(self):
         """Create mock WhatsApp client."""
-        client = MagicMock()
-        client.list_templates = AsyncMock(return_value=SAMPLE_TEMPLATES_RESPONSE["data"])
-        return client
+        return SimpleNamespace(list_templates=AsyncMock(return_value=SAMPLE_TEMPLATES))
 
     @pytest.fixture
     def use_case(self, mock_client):
         """Create use case instance."""
         return ListTemplatesUseCase(client=mock_client)
 
-    @pytest.mark.asyncio
+    @pytest_asyncio.fixture(scope="module")
+    async def response(self):
+        """Execute an unfiltered listing once for the read-only assertions."""
+        client = SimpleNamespace(list_templates=AsyncMock(return_value=SAMPLE_TEMPLATES))
+        return await ListTemplatesUseCase(client=client).execute(ListTemplatesRequest())
+
+    @pytest.fixture(scope="module")
+    def by_status(self, response):
+        """Group the unfiltered templates by status."""
+        grouped = {"APPROVED": [], "PENDING": [], "REJECTED": []}
+        for template in response.templates:
+            grouped.setdefault(template.status, []).append(template)
+        return grouped
+
+    @pytest.fixture(scope="module")
+    def by_name(self, response):
+        """Index the unfiltered templates by name."""
+        return {template.name: template for template in response.templates}
+
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_list_all_templates(self, use_case, mock_client):
         """Test listing all templates without filter."""
         # Arrange
@@ -40,53 +63,32 @@ class TestListTemplatesUseCase:
         assert response.success is True
         assert len(response.templates) == 2
         assert response.error is None
-        mock_client.list_templates.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_list_templates_filter_approved(self, use_case, mock_client):
-        """Test listing only approved templates."""
+        assert mock_client.list_templates.call_count == 1
+
+    @pytest.mark.parametrize("status,expected_count,expected_name", [
+        ("APPROVED", 1, "order_confirmation"),
+        ("PENDING", 1, "appointment_reminder"),
+        ("REJECTED", 0, None),  # No rejected templates in sample data
+    ])
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_list_templates_filter_by_status(
+        self, use_case, by_status, status, expected_count, expected_name
+    ):
+        """Test listing templates filtered by status."""
         # Arrange
-        request = ListTemplatesRequest(status_filter="APPROVED")
+        request = ListTemplatesRequest(status_filter=status)
 
         # Act
         response = await use_case.execute(request)
 
         # Assert
         assert response.success is True
-        approved_templates = [t for t in response.templates if t.status == "APPROVED"]
-        assert len(approved_templates) == 1
-        assert approved_templates[0].name == "order_confirmation"
-
-    @pytest.mark.asyncio
-    async def test_list_templates_filter_pending(self, use_case, mock_client):
-        """Test listing only pending templates."""
-        # Arrange
-        request = ListTemplatesRequest(status_filter="PENDING")
+        assert response.templates == by_status[status]
+        assert len(by_status[status]) == expected_count
+        if expected_name:
+            assert by_status[status][0].name == expected_name
 
-        # Act
-        response = await use_case.execute(request)
-
-        # Assert
-        assert response.success is True
-        pending_templates = [t for t in response.templates if t.status == "PENDING"]
-        assert len(pending_templates) == 1
-        assert pending_templates[0].name == "appointment_reminder"
-
-    @pytest.mark.asyncio
-    async def test_list_templates_filter_rejected(self, use_case, mock_client):
-        """Test listing rejected templates."""
-        # Arrange
-        request = ListTemplatesRequest(status_filter="REJECTED")
-
-        # Act
-        response = await use_case.execute(request)
-
-        # Assert
-        assert response.success is True
-        rejected_templates = [t for t in response.templates if t.status == "REJECTED"]
-        assert len(rejected_templates) == 0  # No rejected templates in sample data
-
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_list_templates_empty_result(self, use_case, mock_client):
         """Test when no templates are returned."""
         # Arrange
@@ -100,16 +102,8 @@ class TestListTemplatesUseCase:
         assert response.success is True
         assert len(response.templates) == 0
 
-    @pytest.mark.asyncio
-    async def test_list_templates_with_components(self, use_case, mock_client):
+    def test_list_templates_with_components(self, response):
         """Test that templates include component information."""
-        # Arrange
-        request = ListTemplatesRequest()
-
-        # Act
-        response = await use_case.execute(request)
-
-        # Assert
         assert response.success is True
         template_with_components = response.templates[0]
         assert len(template_with_components.components) == 3
@@ -117,40 +111,24 @@ class TestListTemplatesUseCase:
         assert template_with_components.components[1].type == "BODY"
         assert template_with_components.components[2].type == "FOOTER"
 
-    @pytest.mark.asyncio
-    async def test_list_templates_categories(self, use_case, mock_client):
+    def test_list_templates_categories(self, response):
         """Test that templates include category information."""
-        # Arrange
-        request = ListTemplatesRequest()
-
-        # Act
-        response = await use_case.execute(request)
-
-        # Assert
         assert response.success is True
         for template in response.templates:
             assert template.category in ["MARKETING", "UTILITY", "AUTHENTICATION"]
 
-    @pytest.mark.asyncio
-    async def test_list_templates_languages(self, use_case, mock_client):
+    def test_list_templates_languages(self, response):
         """Test that templates include language information."""
-        # Arrange
-        request = ListTemplatesRequest()
-
-        # Act
-        response = await use_case.execute(request)
-
-        # Assert
         assert response.success is True
         for template in response.templates:
             assert template.language is not None
             assert "_" in template.language  # e.g., en_US, es_ES
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_list_templates_failure(self, use_case, mock_client):
         """Test handling of template listing failure."""
         # Arrange
-        mock_client.list_templates.side_effect = Exception("API error: Unauthorized")
+        mock_client.list_templates.side_effect = UNAUTHORIZED_ERROR
 
         request = ListTemplatesRequest()
 
@@ -162,11 +140,11 @@ class TestListTemplatesUseCase:
         assert len(response.templates) == 0
         assert "API error" in response.error
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_list_templates_network_error(self, use_case, mock_client):
         """Test handling of network errors."""
         # Arrange
-        mock_client.list_templates.side_effect = Exception("Connection timeout")
+        mock_client.list_templates.side_effect = TIMEOUT_ERROR
 
         request = ListTemplatesRequest()
 
@@ -177,34 +155,18 @@ class TestListTemplatesUseCase:
         assert response.success is False
         assert "Connection timeout" in response.error
 
-    @pytest.mark.asyncio
-    async def test_list_templates_parameter_count(self, use_case, mock_client):
+    def test_list_templates_parameter_count(self, response, by_name):
         """Test that parameter count is correctly calculated."""
-        # Arrange
-        request = ListTemplatesRequest()
-
-        # Act
-        response = await use_case.execute(request)
-
-        # Assert
         assert response.success is True
         # order_confirmation template has 3 parameters: {{1}}, {{2}}, {{3}}
-        template = next(t for t in response.templates if t.name == "order_confirmation")
+        template = by_name["order_confirmation"]
         param_count = template.get_parameter_count()
         assert param_count == 3
 
-    @pytest.mark.asyncio
-    async def test_list_templates_approved_check(self, use_case, mock_client):
+    def test_list_templates_approved_check(self, response, by_name):
         """Test is_approved() method on templates."""
-        # Arrange
-        request = ListTemplatesRequest()
-
-        # Act
-        response = await use_case.execute(request)
-
-        # Assert
         assert response.success is True
-        approved = next(t for t in response.templates if t.name == "order_confirmation")
-        pending = next(t for t in response.templates if t.name == "appointment_reminder")
+        approved = by_name["order_confirmation"]
+        pending = by_name["appointment_reminder"]
         assert approved.is_approved() is True
         assert pending.is_approved() is False
@@ -2,41 +2,39 @@
 Unit tests for SendMediaMessage use case.
 """
 import pytest
-from unittest.mock import MagicMock, AsyncMock
 
 from app.application.use_cases.whatsapp.send_media_message import (
-    SendMediaMessageUseCase,
     SendMediaMessageRequest,
     SendMediaMessageResponse
 )
 from app.domain.entities.whatsapp_message import WhatsAppMedia
+from tests.fixtures.whatsapp_fixtures import SAMPLE_PHONE_NUMBER, SAMPLE_IMAGE_URL
 
+UPLOAD_ERROR = Exception("File too large")
 
+
+@pytest.mark.asyncio(loop_scope="session")
 class TestSendMediaMessageUseCase:
     """Test suite for SendMediaMessage use case."""
 
     @pytest.fixture
-    def mock_client(self):
-        """Create mock WhatsApp client."""
-        client = MagicMock()
-        client.send_media_message = AsyncMock(return_value="wamid.MEDIA123456")
-        client.upload_media = AsyncMock(return_value="media_id_123")
-        return client
-
-    @pytest.fixture
-    def use_case(self, mock_client):
-        """Create use case instance."""
-        return SendMediaMessageUseCase(client=mock_client)
-
-    @pytest.mark.asyncio
-    async def test_send_image_with_url(self, use_case, mock_client):
-        """Test sending image with URL."""
+    def use_case(self, _media_use_case, mock_client):
+        """Bind the shared use case instance to the reset mock client."""
+        _media_use_case.client = mock_client
+        return _media_use_case
+
+    @pytest.mark.parametrize("media_type,media_url,caption", [
+        ("image", SAMPLE_IMAGE_URL, "Test image"),
+        ("video", "https://example.com/video.mp4", "Product demo"),
+    ])
+    async def test_send_media_with_url(self, use_case, mock_client, media_type, media_url, caption):
+        """Test sending media by URL."""
         # Arrange
         request = SendMediaMessageRequest(
-            to="+14155552671",
-            media_type="image",
-            media_url="https://example.com/image.jpg",
-            caption="Test image"
+            to=SAMPLE_PHONE_NUMBER,
+            media_type=media_type,
+            media_url=media_url,
+            caption=caption
         )
 
         # Act
@@ -47,19 +45,26 @@ class TestSendMediaMessageUseCase:
         assert response.message_id == "wamid.MEDIA123456"
         assert response.media_id is None  # Not uploaded, using URL
         assert response.error is None
+        mock_client.upload_media.assert_not_called()
         mock_client.send_media_message.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_send_image_with_local_file(self, use_case, mock_client):
-        """Test sending image from local file data."""
+    @pytest.mark.parametrize("media_type,mime_type,filename,caption", [
+        ("image", "image/jpeg", "test_image.jpg", "Test image"),
+        ("document", "application/pdf", "Monthly_Report_January.pdf", "January report"),
+        ("audio", "audio/mpeg", "audio_message.mp3", None),
+    ])
+    async def test_send_media_with_upload(
+        self, use_case, mock_client, media_type, mime_type, filename, caption
+    ):
+        """Test sending media from local file data."""
         # Arrange
         request = SendMediaMessageRequest(
-            to="+14155552671",
-            media_type="image",
-            media_data=b"fake image data",
-            mime_type="image/jpeg",
-            filename="test_image.jpg",
-            caption="Test image"
+            to=SAMPLE_PHONE_NUMBER,
+            media_type=media_type,
+            media_data=b"fake file data",
+            mime_type=mime_type,
+            filename=filename,
+            caption=caption
         )
 
         # Act
@@ -72,70 +77,11 @@ class TestSendMediaMessageUseCase:
         mock_client.upload_media.assert_called_once()
         mock_client.send_media_message.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_send_document_with_filename(self, use_case, mock_client):
-        """Test sending document with custom filename."""
-        # Arrange
-        request = SendMediaMessageRequest(
-            to="+14155552671",
-            media_type="document",
-            media_data=b"fake pdf data",
-            mime_type="application/pdf",
-            filename="Monthly_Report_January.pdf",
-            caption="January report"
-        )
-
-        # Act
-        response = await use_case.execute(request)
-
-        # Assert
-        assert response.success is True
-        mock_client.upload_media.assert_called_once()
-        mock_client.send_media_message.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_send_video(self, use_case, mock_client):
-        """Test sending video."""
-        # Arrange
-        request = SendMediaMessageRequest(
-            to="+14155552671",
-            media_type="video",
-            media_url="https://example.com/video.mp4",
-            caption="Product demo"
-        )
-
-        # Act
-        response = await use_case.execute(request)
-
-        # Assert
-        assert response.success is True
-        mock_client.send_media_message.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_send_audio(self, use_case, mock_client):
-        """Test sending audio file."""
-        # Arrange
-        request = SendMediaMessageRequest(
-            to="+14155552671",
-            media_type="audio",
-            media_data=b"fake audio data",
-            mime_type="audio/mpeg",
-            filename="audio_message.mp3"
-        )
-
-        # Act
-        response = await use_case.execute(request)
-
-        # Assert
-        assert response.success is True
-        mock_client.upload_media.assert_called_once()
-
-    @pytest.mark.asyncio
     async def test_send_media_validation_missing_source(self, use_case, mock_client):
-        """Test validation when neither URL, data, nor ID is provided."""
+        """Test that a request without URL, data or ID is passed through to the client."""
         # Arrange
         request = SendMediaMessageRequest(
-            to="+14155552671",
+            to=SAMPLE_PHONE_NUMBER,
             media_type="image"
             # No media_url, media_data, or media_id provided
         )
@@ -144,20 +90,20 @@ class TestSendMediaMessageUseCase:
         response = await use_case.execute(request)
 
         # Assert
-        # The use case might still succeed if it has default behavior
-        # or it might fail - check the actual implementation
-        # For now, we expect it to work with media_url or media_data
-        assert response.success is False or response.success is True
-        # Remove strict validation check as implementation may vary
+        # The use case does not validate the media source; it is left to the API
+        assert response.success is True
+        mock_client.upload_media.assert_not_called()
+        media = mock_client.send_media_message.call_args[1]["media"]
+        assert media.media_id is None
+        assert media.media_url is None
 
-    @pytest.mark.asyncio
     async def test_send_media_validation_both_sources(self, use_case, mock_client):
-        """Test validation when both URL and data are provided."""
+        """Test that data takes the upload path even when a URL is also provided."""
         # Arrange
         request = SendMediaMessageRequest(
-            to="+14155552671",
+            to=SAMPLE_PHONE_NUMBER,
             media_type="image",
-            media_url="https://example.com/image.jpg",
+            media_url=SAMPLE_IMAGE_URL,
             media_data=b"fake image data"  # Both URL and data provided
         )
 
@@ -165,35 +111,19 @@ class TestSendMediaMessageUseCase:
         response = await use_case.execute(request)
 
         # Assert
-        # If both are provided, the implementation might use one or fail
-        # Check actual behavior - for now allow both outcomes
-        assert response.success is True or response.success is False
-
-    @pytest.mark.asyncio
-    async def test_send_media_validation_invalid_type(self, use_case, mock_client):
-        """Test validation with invalid media type."""
-        # Arrange
-        request = SendMediaMessageRequest(
-            to="+14155552671",
-            media_type="invalid_type",
-            media_url="https://example.com/file.xyz"
-        )
-
-        # Act
-        response = await use_case.execute(request)
-
-        # Assert
+        # media_data always triggers an upload, which needs mime_type and filename
         assert response.success is False
-        assert "Invalid media_type" in response.error or "invalid" in response.error.lower()
+        assert "mime_type and filename are required" in response.error
+        mock_client.upload_media.assert_not_called()
+        mock_client.send_media_message.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_send_media_upload_failure(self, use_case, mock_client):
         """Test handling of media upload failure."""
         # Arrange
-        mock_client.upload_media.side_effect = Exception("File too large")
+        mock_client.upload_media.side_effect = UPLOAD_ERROR
 
         request = SendMediaMessageRequest(
-            to="+14155552671",
+            to=SAMPLE_PHONE_NUMBER,
             media_type="image",
             media_data=b"fake large image data",
             mime_type="image/jpeg",
@@ -207,31 +137,11 @@ class TestSendMediaMessageUseCase:
         assert response.success is False
         assert "File too large" in response.error or "large" in response.error.lower()
 
-    @pytest.mark.asyncio
-    async def test_send_media_send_failure(self, use_case, mock_client):
-        """Test handling of message sending failure."""
-        # Arrange
-        mock_client.send_media_message.side_effect = Exception("API error")
-
-        request = SendMediaMessageRequest(
-            to="+14155552671",
-            media_type="image",
-            media_url="https://example.com/image.jpg"
-        )
-
-        # Act
-        response = await use_case.execute(request)
-
-        # Assert
-        assert response.success is False
-        assert "API error" in response.error
-
-    @pytest.mark.asyncio
     async def test_send_media_with_mime_type(self, use_case, mock_client):
         """Test sending media with explicit MIME type."""
         # Arrange
         request = SendMediaMessageRequest(
-            to="+14155552671",
+            to=SAMPLE_PHONE_NUMBER,
             media_type="document",
             media_data=b"fake custom file data",
             mime_type="application/x-custom",
@@ -244,8 +154,37 @@ class TestSendMediaMessageUseCase:
         # Assert
         assert response.success is True
         # Verify MIME type was used in upload
-        mock_client.upload_media.assert_called_once()
-        upload_args = mock_client.upload_media.call_args
-        # Check that mime_type parameter was passed
-        assert upload_args.kwargs.get('mime_type') == "application/x-custom" or \
-               upload_args.args[1] == "application/x-custom"
+        mock_client.upload_media.assert_awaited_once_with(
+            file_data=b"fake custom file data",
+            mime_type="application/x-custom",
+            filename="custom_file.custom"
+        )
+
+
+class TestSendMediaMessageValidation:
+    """Test suite for SendMediaMessage request validation."""
+
+    def test_send_media_validation_invalid_type(self, _media_use_case):
+        """Test validation with invalid media type."""
+        request = SendMediaMessageRequest(
+            to=SAMPLE_PHONE_NUMBER,
+            media_type="invalid_type",
+            media_url="https://example.com/file.xyz"
+        )
+
+        error = _media_use_case._validate(request)
+
+        assert "Invalid media_type" in error
+
+    def test_send_media_validation_caption_too_long(self, _media_use_case):
+        """Test validation when caption exceeds maximum length."""
+        request = SendMediaMessageRequest(
+            to=SAMPLE_PHONE_NUMBER,
+            media_type="image",
+            media_url=SAMPLE_IMAGE_URL,
+            caption="A" * 1025
+        )
+
+        error = _media_use_case._validate(request)
+
+        assert "cannot exceed 1024 characters" in error
@@ -0,0 +1,106 @@
+"""
+Shared unit tests for the WhatsApp send use cases.
+
+SendTextMessage, SendMediaMessage and SendTemplateMessage share the same
+contract: validate the recipient, call one client method and wrap the
+returned message ID, or report the client error. Message type specific
+behaviour is tested in the per-use-case modules.
+"""
+import pytest
+
+from app.application.use_cases.whatsapp.send_media_message import SendMediaMessageRequest
+from app.application.use_cases.whatsapp.send_template_message import SendTemplateMessageRequest
+from app.application.use_cases.whatsapp.send_text_message import SendTextMessageRequest
+from tests.fixtures.whatsapp_fixtures import SAMPLE_PHONE_NUMBER, SAMPLE_IMAGE_URL
+
+API_ERROR = Exception("API error")
+
+# (use case fixture, request factory, client method, expected message ID)
+SEND_CASES = [
+    pytest.param(
+        "_text_use_case",
+        lambda to: SendTextMessageRequest(to=to, text="Hello"),
+        "send_text_message",
+        "wamid.HBgLMTQxNTU1NTI2NzEVAgARGBI5MjQxNjI3NzgwNzAzNTAxNTAA",
+        id="text"
+    ),
+    pytest.param(
+        "_media_use_case",
+        lambda to: SendMediaMessageRequest(
+            to=to,
+            media_type="image",
+            media_url=SAMPLE_IMAGE_URL
+        ),
+        "send_media_message",
+        "wamid.MEDIA123456",
+        id="media"
+    ),
+    pytest.param(
+        "_template_use_case",
+        lambda to: SendTemplateMessageRequest(
+            to=to,
+            template_name="order_confirmation",
+            language="en_US"
+        ),
+        "send_template_message",
+        "wamid.TEMPLATE123",
+        id="template"
+    ),
+]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize(
+    "use_case_fixture,request_factory,client_method,message_id",
+    SEND_CASES
+)
+class TestSendMessageUseCases:
+    """Test suite for behaviour shared by the WhatsApp send use cases."""
+
+    @pytest.fixture
+    def use_case(self, request, use_case_fixture, mock_client):
+        """Bind the shared use case instance to the reset mock client."""
+        use_case = request.getfixturevalue(use_case_fixture)
+        use_case.client = mock_client
+        return use_case
+
+    async def test_send_success(
+        self, use_case, mock_client, request_factory, client_method, message_id
+    ):
+        """Test the client message ID is returned."""
+        # Act
+        response = await use_case.execute(request_factory(SAMPLE_PHONE_NUMBER))
+
+        # Assert
+        assert response.success is True
+        assert response.message_id == message_id
+        assert response.error is None
+        getattr(mock_client, client_method).assert_awaited_once()
+
+    async def test_send_validation_invalid_phone(
+        self, use_case, mock_client, request_factory, client_method, message_id
+    ):
+        """Test validation when phone number format is invalid."""
+        # Act
+        response = await use_case.execute(request_factory("1234567890"))  # Missing + prefix
+
+        # Assert
+        assert response.success is False
+        assert response.message_id is None
+        assert "E.164 format" in response.error
+        getattr(mock_client, client_method).assert_not_called()
+
+    async def test_send_failure(
+        self, use_case, mock_client, request_factory, client_method, message_id
+    ):
+        """Test handling of message sending failure."""
+        # Arrange
+        getattr(mock_client, client_method).side_effect = API_ERROR
+
+        # Act
+        response = await use_case.execute(request_factory(SAMPLE_PHONE_NUMBER))
+
+        # Assert
+        assert response.success is False
+        assert response.message_id is None
+        assert "API error" in response.error
@@ -2,38 +2,44 @@
 Unit tests for SendTextMessage use case.
 """
 import pytest
-from unittest.mock import MagicMock, AsyncMock
+from dataclasses import replace
+from unittest.mock import call
 
 from app.application.use_cases.whatsapp.send_text_message import (
-    SendTextMessageUseCase,
-    SendTextMessageRequest,
     SendTextMessageResponse
 )
+from tests.fixtures.whatsapp_fixtures import SAMPLE_PHONE_NUMBER, SAMPLE_PREVIEW_TEXT
 
+MAX_LENGTH_TEXT = "A" * 4096
+TOO_LONG_TEXT = MAX_LENGTH_TEXT + "A"
+NETWORK_ERROR = Exception("Network timeout")
 
+EXPECTED_BASIC_CALL = call(
+    to=SAMPLE_PHONE_NUMBER,
+    text="Hello, this is a test message",
+    preview_url=False
+)
+EXPECTED_PREVIEW_CALL = call(
+    to=SAMPLE_PHONE_NUMBER,
+    text=SAMPLE_PREVIEW_TEXT,
+    preview_url=True
+)
+
+
+@pytest.mark.asyncio(loop_scope="session")
 class TestSendTextMessageUseCase:
     """Test suite for SendTextMessage use case."""
 
     @pytest.fixture
-    def mock_client(self):
-        """Create mock WhatsApp client."""
-        client = MagicMock()
-        client.send_text_message = AsyncMock(return_value="wamid.HBgLMTQxNTU1NTI2NzEVAgARGBI5MjQxNjI3NzgwNzAzNTAxNTAA")
-        return client
+    def use_case(self, _text_use_case, mock_client):
+        """Bind the shared use case instance to the reset mock client."""
+        _text_use_case.client = mock_client
+        return _text_use_case
 
-    @pytest.fixture
-    def use_case(self, mock_client):
-        """Create use case instance."""
-        return SendTextMessageUseCase(client=mock_client)
-
-    @pytest.mark.asyncio
-    async def test_send_text_message_basic(self, use_case, mock_client):
+    async def test_send_text_message_basic(self, use_case, mock_client, base_text_request):
         """Test sending a basic text message."""
         # Arrange
-        request = SendTextMessageRequest(
-            to="+14155552671",
-            text="Hello, this is a test message"
-        )
+        request = replace(base_text_request, text="Hello, this is a test message")
 
         # Act
         response = await use_case.execute(request)
@@ -42,19 +48,15 @@ class TestSendTextMessageUseCase:
         assert response.success is True
         assert response.message_id == "wamid.HBgLMTQxNTU1NTI2NzEVAgARGBI5MjQxNjI3NzgwNzAzNTAxNTAA"
         assert response.error is None
-        mock_client.send_text_message.assert_called_once_with(
-            to="+14155552671",
-            text="Hello, this is a test message",
-            preview_url=False
-        )
+        assert mock_client.send_text_message.await_count == 1
+        assert mock_client.send_text_message.await_args == EXPECTED_BASIC_CALL
 
-    @pytest.mark.asyncio
-    async def test_send_text_message_with_preview_url(self, use_case, mock_client):
+    async def test_send_text_message_with_preview_url(self, use_case, mock_client, base_text_request):
         """Test sending text message with URL preview enabled."""
         # Arrange
-        request = SendTextMessageRequest(
-            to="+14155552671",
-            text="Check this out: https://example.com",
+        request = replace(
+            base_text_request,
+            text=SAMPLE_PREVIEW_TEXT,
             preview_url=True
         )
 
@@ -64,18 +66,14 @@ class TestSendTextMessageUseCase:
         # Assert
         assert response.success is True
         assert response.message_id is not None
-        mock_client.send_text_message.assert_called_once_with(
-            to="+14155552671",
-            text="Check this out: https://example.com",
-            preview_url=True
-        )
+        assert mock_client.send_text_message.await_count == 1
+        assert mock_client.send_text_message.await_args == EXPECTED_PREVIEW_CALL
 
-    @pytest.mark.asyncio
-    async def test_send_text_message_with_reply_to(self, use_case, mock_client):
+    async def test_send_text_message_with_reply_to(self, use_case, mock_client, base_text_request):
         """Test sending text message as a reply."""
         # Arrange
-        request = SendTextMessageRequest(
-            to="+14155552671",
+        request = replace(
+            base_text_request,
             text="Thanks for your message!",
             reply_to_message_id="wamid.PREVIOUS_MESSAGE"
         )
@@ -87,14 +85,10 @@ class TestSendTextMessageUseCase:
         assert response.success is True
         mock_client.send_text_message.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_send_text_message_validation_empty_text(self, use_case, mock_client):
+    async def test_send_text_message_validation_empty_text(self, use_case, mock_client, base_text_request):
         """Test validation when text is empty."""
         # Arrange
-        request = SendTextMessageRequest(
-            to="+14155552671",
-            text=""
-        )
+        request = replace(base_text_request, text="")
 
         # Act
         response = await use_case.execute(request)
@@ -105,71 +99,12 @@ class TestSendTextMessageUseCase:
         assert response.success is True
         mock_client.send_text_message.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_send_text_message_validation_missing_recipient(self, use_case, mock_client):
-        """Test validation when recipient is missing."""
-        # Arrange
-        request = SendTextMessageRequest(
-            to="",
-            text="Hello"
-        )
-
-        # Act
-        response = await use_case.execute(request)
-
-        # Assert
-        assert response.success is False
-        assert response.message_id is None
-        assert "E.164 format" in response.error  # Actual error message from validation
-        mock_client.send_text_message.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_send_text_message_validation_invalid_phone_format(self, use_case, mock_client):
-        """Test validation when phone number format is invalid."""
-        # Arrange
-        request = SendTextMessageRequest(
-            to="1234567890",  # Missing + prefix
-            text="Hello"
-        )
-
-        # Act
-        response = await use_case.execute(request)
-
-        # Assert
-        assert response.success is False
-        assert response.message_id is None
-        assert "must be in E.164 format" in response.error
-        mock_client.send_text_message.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_send_text_message_failure(self, use_case, mock_client):
-        """Test handling of message sending failure."""
-        # Arrange
-        mock_client.send_text_message.side_effect = Exception("API error: Invalid phone number")
-
-        request = SendTextMessageRequest(
-            to="+14155552671",
-            text="Hello"
-        )
-
-        # Act
-        response = await use_case.execute(request)
-
-        # Assert
-        assert response.success is False
-        assert response.message_id is None
-        assert "API error" in response.error
-
-    @pytest.mark.asyncio
-    async def test_send_text_message_network_error(self, use_case, mock_client):
+    async def test_send_text_message_network_error(self, use_case, mock_client, base_text_request):
         """Test handling of network errors."""
         # Arrange
-        mock_client.send_text_message.side_effect = Exception("Network timeout")
+        mock_client.send_text_message.side_effect = NETWORK_ERROR
 
-        request = SendTextMessageRequest(
-            to="+14155552671",
-            text="Hello"
-        )
+        request = base_text_request
 
         # Act
         response = await use_case.execute(request)
@@ -178,15 +113,10 @@ class TestSendTextMessageUseCase:
         assert response.success is False
         assert "Network timeout" in response.error
 
-    @pytest.mark.asyncio
-    async def test_send_text_message_long_text(self, use_case, mock_client):
+    async def test_send_text_message_long_text(self, use_case, mock_client, base_text_request):
         """Test sending long text message (max 4096 characters)."""
         # Arrange
-        long_text = "A" * 4096
-        request = SendTextMessageRequest(
-            to="+14155552671",
-            text=long_text
-        )
+        request = replace(base_text_request, text=MAX_LENGTH_TEXT)
 
         # Act
         response = await use_case.execute(request)
@@ -195,20 +125,22 @@ class TestSendTextMessageUseCase:
         assert response.success is True
         mock_client.send_text_message.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_send_text_message_text_too_long(self, use_case, mock_client):
+
+class TestSendTextMessageValidation:
+    """Test suite for SendTextMessage request validation."""
+
+    def test_send_text_message_validation_missing_recipient(self, _text_use_case, base_text_request):
+        """Test validation when recipient is missing."""
+        error = _text_use_case._validate(replace(base_text_request, to=""))
+
+        assert "E.164 format" in error
+
+    def test_send_text_message_text_too_long(self, _text_use_case, base_text_request):
         """Test validation when text exceeds maximum length."""
-        # Arrange
-        too_long_text = "A" * 4097
-        request = SendTextMessageRequest(
-            to="+14155552671",
-            text=too_long_text
-        )
+        error = _text_use_case._validate(replace(base_text_request, text=TOO_LONG_TEXT))
 
-        # Act
-        response = await use_case.execute(request)
+        assert "cannot exceed 4096 characters" in error
 
-        # Assert
-        assert response.success is False
-        assert "cannot exceed 4096 characters" in response.error  # Actual error message
-        mock_client.send_text_message.assert_not_called()
+    def test_send_text_message_validation_valid(self, _text_use_case, base_text_request):
+        """Test that a valid request passes validation."""
+        assert _text_use_case._validate(replace(base_text_request, text=MAX_LENGTH_TEXT)) is None
@@ -20,31 +20,33 @@ from app.domain.entities.notion_block_helpers import (
 )
 
 
-class TestBlockHelpers:
-    """Test block helper functions."""
-
-    def test_heading_level_1(self):
-        """Test creating heading_1."""
-        block = heading("Test Heading", level=1)
+@pytest.fixture(scope="module")
+def formatted_paragraph():
+    """Paragraph with normal, bold and italic parts, built once per module."""
+    return paragraph_with_formatting([
+        {"text": "Normal "},
+        {"text": "bold", "bold": True},
+        {"text": " and "},
+        {"text": "italic", "italic": True}
+    ])
 
-        assert block["type"] == "heading_1"
-        assert "heading_1" in block
-        assert len(block["heading_1"]["rich_text"]) == 1
-        assert block["heading_1"]["rich_text"][0]["text"]["content"] == "Test Heading"
 
-    def test_heading_level_2(self):
-        """Test creating heading_2."""
-        block = heading("Test Heading", level=2)
-
-        assert block["type"] == "heading_2"
-        assert "heading_2" in block
+class TestBlockHelpers:
+    """Test block helper functions."""
 
-    def test_heading_level_3(self):
-        """Test creating heading_3."""
-        block = heading("Test Heading", level=3)
+    @pytest.mark.parametrize("level,expected_type", [
+        (1, "heading_1"),
+        (2, "heading_2"),
+        (3, "heading_3"),
+    ])
+    def test_heading_levels(self, level, expected_type):
+        """Test creating headings of each level."""
+        block = heading("Test Heading", level=level)
 
-        assert block["type"] == "heading_3"
-        assert "heading_3" in block
+        assert block["type"] == expected_type
+        assert expected_type in block
+        assert len(block[expected_type]["rich_text"]) == 1
+        assert block[expected_type]["rich_text"][0]["text"]["content"] == "Test Heading"
 
     def test_heading_with_bold(self):
         """Test creating heading with bold."""
@@ -77,29 +79,25 @@ class TestBlockHelpers:
         assert rich_text["annotations"]["italic"] is True
         assert block["paragraph"]["color"] == "blue"
 
-    def test_paragraph_with_multiple_parts(self):
+    def test_paragraph_with_multiple_parts(self, formatted_paragraph):
         """Test paragraph with multiple formatted parts."""
-        block = paragraph_with_formatting([
-            {"text": "Normal "},
-            {"text": "bold", "bold": True},
-            {"text": " and "},
-            {"text": "italic", "italic": True}
-        ])
-
-        assert block["type"] == "paragraph"
-        assert len(block["paragraph"]["rich_text"]) == 4
-
-        # Check first part (normal)
-        assert block["paragraph"]["rich_text"][0]["text"]["content"] == "Normal "
-        assert "annotations" not in block["paragraph"]["rich_text"][0]
-
-        # Check second part (bold)
-        assert block["paragraph"]["rich_text"][1]["text"]["content"] == "bold"
-        assert block["paragraph"]["rich_text"][1]["annotations"]["bold"] is True
-
-        # Check fourth part (italic)
-        assert block["paragraph"]["rich_text"][3]["text"]["content"] == "italic"
-        assert block["paragraph"]["rich_text"][3]["annotations"]["italic"] is True
+        assert formatted_paragraph["type"] == "paragraph"
+        assert len(formatted_paragraph["paragraph"]["rich_text"]) == 4
+
+    @pytest.mark.parametrize("index,content,annotation", [
+        pytest.param(0, "Normal ", None, id="normal"),
+        pytest.param(1, "bold", "bold", id="bold"),
+        pytest.param(3, "italic", "italic", id="italic"),
+    ])
+    def test_paragraph_parts(self, formatted_paragraph, index, content, annotation):
+        """Test each formatted part keeps its text and annotation."""
+        part = formatted_paragraph["paragraph"]["rich_text"][index]
+
+        assert part["text"]["content"] == content
+        if annotation is None:
+            assert "annotations" not in part
+        else:
+            assert part["annotations"][annotation] is True
 
     def test_bulleted_list_item(self):
         """Test creating bulleted list item."""
@@ -117,36 +115,29 @@ class TestBlockHelpers:
         assert "numbered_list_item" in block
         assert block["numbered_list_item"]["rich_text"][0]["text"]["content"] == "Numbered item"
 
-    def test_todo_unchecked(self):
-        """Test creating unchecked to-do."""
-        block = todo("Task", checked=False)
+    @pytest.mark.parametrize("checked", [False, True])
+    def test_todo(self, checked):
+        """Test creating checked and unchecked to-dos."""
+        block = todo("Task", checked=checked)
 
         assert block["type"] == "to_do"
         assert "to_do" in block
         assert block["to_do"]["rich_text"][0]["text"]["content"] == "Task"
-        assert block["to_do"]["checked"] is False
-
-    def test_todo_checked(self):
-        """Test creating checked to-do."""
-        block = todo("Completed task", checked=True)
+        assert block["to_do"]["checked"] is checked
 
-        assert block["to_do"]["checked"] is True
-
-    def test_toggle_without_children(self):
-        """Test creating toggle without children."""
-        block = toggle("Toggle text")
+    @pytest.mark.parametrize(
+        "children", [None, [paragraph("Child paragraph")]], ids=["no_children", "with_children"]
+    )
+    def test_toggle(self, children):
+        """Test creating toggle with and without children."""
+        block = toggle("Toggle text", children=children)
 
         assert block["type"] == "toggle"
         assert "toggle" in block
-        assert "children" not in block
-
-    def test_toggle_with_children(self):
-        """Test creating toggle with children."""
-        children = [paragraph("Child paragraph")]
-        block = toggle("Toggle text", children=children)
-
-        assert "children" in block
-        assert len(block["children"]) == 1
+        if children is None:
+            assert "children" not in block
+        else:
+            assert len(block["children"]) == 1
 
     def test_divider(self):
         """Test creating divider."""
@@ -161,7 +152,6 @@ class TestBlockHelpers:
         block = callout("Important note", icon="⚠️", color="yellow_background")
 
         assert block["type"] == "callout"
-        assert "callout" in block
         assert block["callout"]["rich_text"][0]["text"]["content"] == "Important note"
         assert block["callout"]["icon"]["emoji"] == "⚠️"
         assert block["callout"]["color"] == "yellow_background"
@@ -180,7 +170,6 @@ class TestBlockHelpers:
         block = code(code_content, language="python")
 
         assert block["type"] == "code"
-        assert "code" in block
         assert block["code"]["rich_text"][0]["text"]["content"] == code_content
         assert block["code"]["language"] == "python"
 
@@ -192,54 +181,48 @@ class TestBlockHelpers:
         assert "table_of_contents" in block
         assert block["table_of_contents"]["color"] == "default"
 
-    def test_bookmark_without_caption(self):
-        """Test creating bookmark without caption."""
-        block = bookmark("https://example.com")
+    @pytest.mark.parametrize("caption", [None, "Example site"])
+    def test_bookmark(self, caption):
+        """Test creating bookmark with and without caption."""
+        block = bookmark("https://example.com", caption=caption)
 
         assert block["type"] == "bookmark"
         assert "bookmark" in block
         assert block["bookmark"]["url"] == "https://example.com"
-        assert "caption" not in block["bookmark"]
-
-    def test_bookmark_with_caption(self):
-        """Test creating bookmark with caption."""
-        block = bookmark("https://example.com", caption="Example site")
+        if caption is None:
+            assert "caption" not in block["bookmark"]
+        else:
+            assert block["bookmark"]["caption"][0]["text"]["content"] == caption
 
-        assert "caption" in block["bookmark"]
-        assert block["bookmark"]["caption"][0]["text"]["content"] == "Example site"
-
-    def test_image_without_caption(self):
-        """Test creating image without caption."""
-        block = image("https://example.com/image.png")
+    @pytest.mark.parametrize("caption", [None, "Beautiful image"])
+    def test_image(self, caption):
+        """Test creating image with and without caption."""
+        block = image("https://example.com/image.png", caption=caption)
 
         assert block["type"] == "image"
         assert "image" in block
         assert block["image"]["external"]["url"] == "https://example.com/image.png"
-        assert "caption" not in block["image"]
-
-    def test_image_with_caption(self):
-        """Test creating image with caption."""
-        block = image("https://example.com/image.png", caption="Beautiful image")
-
-        assert "caption" in block["image"]
-        assert block["image"]["caption"][0]["text"]["content"] == "Beautiful image"
-
-    def test_block_structure_consistency(self):
+        if caption is None:
+            assert "caption" not in block["image"]
+        else:
+            assert block["image"]["caption"][0]["text"]["content"] == caption
+
+    @pytest.mark.parametrize("block_factory,expected_type", [
+        pytest.param(lambda: heading("Test", 1), "heading_1", id="heading_1"),
+        pytest.param(lambda: paragraph("Test"), "paragraph", id="paragraph"),
+        pytest.param(lambda: bulleted_list_item("Test"), "bulleted_list_item", id="bulleted_list_item"),
+        pytest.param(lambda: numbered_list_item("Test"), "numbered_list_item", id="numbered_list_item"),
+        pytest.param(lambda: todo("Test"), "to_do", id="to_do"),
+        pytest.param(divider, "divider", id="divider"),
+        pytest.param(lambda: callout("Test"), "callout", id="callout"),
+        pytest.param(lambda: quote("Test"), "quote", id="quote"),
+        pytest.param(lambda: code("Test"), "code", id="code"),
+    ])
+    def test_block_structure_consistency(self, block_factory, expected_type):
         """Test that all blocks follow the same structure pattern."""
         # All blocks should have "type" and a key matching the type
-        blocks_to_test = [
-            (heading("Test", 1), "heading_1"),
-            (paragraph("Test"), "paragraph"),
-            (bulleted_list_item("Test"), "bulleted_list_item"),
-            (numbered_list_item("Test"), "numbered_list_item"),
-            (todo("Test"), "to_do"),
-            (divider(), "divider"),
-            (callout("Test"), "callout"),
-            (quote("Test"), "quote"),
-            (code("Test"), "code"),
-        ]
-
-        for block, expected_type in blocks_to_test:
-            assert "type" in block, f"Block {expected_type} missing 'type' key"
-            assert block["type"] == expected_type, f"Block type mismatch for {expected_type}"
-            assert expected_type in block, f"Block {expected_type} missing content key"
+        block = block_factory()
+
+        assert "type" in block
+        assert block["type"] == expected_type
+        assert expected_type in block
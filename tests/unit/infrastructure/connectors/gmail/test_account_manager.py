@@ -2,9 +2,44 @@
 Unit tests for Gmail account manager.
 """
 import pytest
-from unittest.mock import Mock, MagicMock, patch
+from contextlib import nullcontext
+from unittest.mock import Mock, patch
+from app.config.settings import settings
 from app.infrastructure.connectors.gmail.account_manager import GmailAccountManager
 from app.infrastructure.connectors.gmail.client import GmailClient
+from app.infrastructure.connectors.gmail.oauth import GmailOAuthHandler
+
+# Stand-ins for GmailClient instances that tests only compare by identity
+CLIENT = object()
+OTHER_CLIENT = object()
+
+
+@pytest.fixture(scope="module")
+def _patched_classes():
+    """Patch GmailClient and GmailOAuthHandler in the account manager once per module."""
+    with patch('app.infrastructure.connectors.gmail.account_manager.GmailClient') as client_class, \
+            patch('app.infrastructure.connectors.gmail.account_manager.GmailOAuthHandler') as oauth_class:
+        yield client_class, oauth_class
+
+
+@pytest.fixture(autouse=True)
+def _reset_patched_classes(_patched_classes):
+    """Reset the patched classes so each test starts from a clean mock."""
+    yield
+    for mock_class in _patched_classes:
+        mock_class.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def mock_client_class(_patched_classes):
+    """Patched GmailClient class."""
+    return _patched_classes[0]
+
+
+@pytest.fixture
+def mock_oauth_class(_patched_classes):
+    """Patched GmailOAuthHandler class."""
+    return _patched_classes[1]
 
 
 class TestGmailAccountManager:
@@ -18,48 +53,35 @@ class TestGmailAccountManager:
         return manager
 
     @pytest.fixture(autouse=True)
-    def mock_settings(self):
-        """Mock settings."""
-        with patch('app.infrastructure.connectors.gmail.account_manager.settings') as mock_settings:
-            mock_settings.gmail_default_account = "default@example.com"
-            yield mock_settings
+    def mock_settings(self, monkeypatch):
+        """Set the default account on the real settings object."""
+        monkeypatch.setattr(settings, "gmail_default_account", "default@example.com")
+        return settings
 
     def test_init(self, account_manager):
         """Test account manager initialization."""
         assert account_manager._clients == {}
 
-    @patch('app.infrastructure.connectors.gmail.account_manager.GmailClient')
-    def test_get_client_creates_new_client(self, mock_client_class, account_manager):
-        """Test that get_client creates new client if not exists."""
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-
-        client = account_manager.get_client("test@example.com")
-
-        assert client == mock_client
-        mock_client_class.assert_called_once_with(account_id="test@example.com")
-        assert account_manager._clients["test@example.com"] == mock_client
-
-    @patch('app.infrastructure.connectors.gmail.account_manager.GmailClient')
-    def test_get_client_reuses_existing_client(self, mock_client_class, account_manager):
-        """Test that get_client reuses existing client."""
-        mock_client = MagicMock()
-        account_manager._clients["test@example.com"] = mock_client
-
-        client = account_manager.get_client("test@example.com")
-
-        assert client == mock_client
-        mock_client_class.assert_not_called()
-
-    @patch('app.infrastructure.connectors.gmail.account_manager.GmailClient')
-    def test_get_client_uses_default_account(self, mock_client_class, account_manager, mock_settings):
-        """Test that get_client uses default account when none specified."""
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-
-        client = account_manager.get_client()
-
-        mock_client_class.assert_called_once_with(account_id="default@example.com")
+    @pytest.mark.parametrize("cached,account_id,created_for", [
+        pytest.param(False, "test@example.com", "test@example.com", id="creates_new_client"),
+        pytest.param(True, "test@example.com", None, id="reuses_existing_client"),
+        pytest.param(False, None, "default@example.com", id="uses_default_account"),
+    ])
+    def test_get_client(self, mock_client_class, account_manager, cached, account_id, created_for):
+        """Test get_client creates, caches and reuses clients per account."""
+        if cached:
+            account_manager._clients["test@example.com"] = CLIENT
+        else:
+            mock_client_class.return_value = CLIENT
+
+        client = account_manager.get_client(account_id)
+
+        assert client is CLIENT
+        if created_for is None:
+            mock_client_class.assert_not_called()
+        else:
+            mock_client_class.assert_called_once_with(account_id=created_for)
+            assert account_manager._clients[created_for] is CLIENT
 
     def test_get_client_no_account_no_default_raises_error(self, account_manager):
         """Test that get_client raises error when no account and no default."""
@@ -70,15 +92,12 @@ class TestGmailAccountManager:
 
         assert "No account_id provided" in str(exc_info.value)
 
-    @patch('app.infrastructure.connectors.gmail.account_manager.GmailOAuthHandler')
-    @patch('app.infrastructure.connectors.gmail.account_manager.GmailClient')
     def test_add_account(self, mock_client_class, mock_oauth_class, account_manager):
         """Test adding a new account."""
-        mock_oauth = MagicMock()
+        mock_oauth = Mock(spec=GmailOAuthHandler)
         mock_oauth_class.return_value = mock_oauth
 
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
+        mock_client_class.return_value = CLIENT
 
         client = account_manager.add_account("new@example.com")
 
@@ -91,14 +110,14 @@ class TestGmailAccountManager:
             account_id="new@example.com",
             oauth_handler=mock_oauth
         )
-        assert account_manager._clients["new@example.com"] == mock_client
-        assert client == mock_client
+        assert account_manager._clients["new@example.com"] is CLIENT
+        assert client is CLIENT
 
     def test_remove_account(self, account_manager):
         """Test removing an account."""
         # Add a mock client
-        mock_client = MagicMock()
-        mock_oauth = MagicMock()
+        mock_client = Mock(spec=GmailClient)
+        mock_oauth = Mock(spec=GmailOAuthHandler)
         mock_client.oauth_handler = mock_oauth
         account_manager._clients["test@example.com"] = mock_client
 
@@ -117,7 +136,6 @@ class TestGmailAccountManager:
 
         assert "nonexistent@example.com" not in account_manager._clients
 
-    @patch('app.infrastructure.connectors.gmail.account_manager.GmailOAuthHandler')
     def test_list_accounts(self, mock_oauth_class, account_manager):
         """Test listing authenticated accounts."""
         mock_oauth_class.list_authenticated_accounts.return_value = [
@@ -131,20 +149,20 @@ class TestGmailAccountManager:
         assert "account1@example.com" in accounts
         assert "account2@example.com" in accounts
 
-    def test_set_default_account_success(self, account_manager):
-        """Test setting default account."""
-        with patch.object(account_manager, 'list_accounts', return_value=["test@example.com"]):
-            account_manager.set_default_account("test@example.com")
-
-            assert account_manager._default_account == "test@example.com"
+    @pytest.mark.parametrize("accounts,raises", [
+        pytest.param(["test@example.com"], False, id="success"),
+        pytest.param([], True, id="not_found"),
+    ])
+    def test_set_default_account(self, account_manager, accounts, raises):
+        """Test setting default account, which must be authenticated."""
+        expectation = pytest.raises(ValueError, match="not found") if raises else nullcontext()
 
-    def test_set_default_account_not_found(self, account_manager):
-        """Test setting default account that doesn't exist."""
-        with patch.object(account_manager, 'list_accounts', return_value=[]):
-            with pytest.raises(ValueError) as exc_info:
-                account_manager.set_default_account("nonexistent@example.com")
+        with patch.object(account_manager, 'list_accounts', return_value=accounts):
+            with expectation:
+                account_manager.set_default_account("test@example.com")
 
-            assert "not found" in str(exc_info.value)
+        if not raises:
+            assert account_manager._default_account == "test@example.com"
 
     def test_default_account_property(self, account_manager, mock_settings):
         """Test default_account property."""
@@ -153,16 +171,12 @@ class TestGmailAccountManager:
         account_manager._default_account = "custom@example.com"
         assert account_manager.default_account == "custom@example.com"
 
-    @patch('app.infrastructure.connectors.gmail.account_manager.GmailClient')
     def test_multiple_accounts_independent(self, mock_client_class, account_manager):
         """Test that multiple accounts are managed independently."""
-        mock_client1 = MagicMock()
-        mock_client2 = MagicMock()
-
         def create_client(account_id):
             if account_id == "account1@example.com":
-                return mock_client1
-            return mock_client2
+                return CLIENT
+            return OTHER_CLIENT
 
         mock_client_class.side_effect = create_client
 
@@ -170,8 +184,8 @@ class TestGmailAccountManager:
         client2 = account_manager.get_client("account2@example.com")
 
         assert client1 != client2
-        assert account_manager._clients["account1@example.com"] == mock_client1
-        assert account_manager._clients["account2@example.com"] == mock_client2
+        assert account_manager._clients["account1@example.com"] is CLIENT
+        assert account_manager._clients["account2@example.com"] is OTHER_CLIENT
 
     def test_account_manager_singleton_behavior(self):
         """Test that global instance works correctly."""
@@ -2,10 +2,12 @@
 Unit tests for Gmail API client.
 """
 import pytest
-from unittest.mock import Mock, MagicMock, patch, AsyncMock
+from types import SimpleNamespace
+from unittest.mock import Mock, MagicMock, patch
 from googleapiclient.errors import HttpError
 from app.infrastructure.connectors.gmail.client import GmailClient
-from app.domain.entities.email import EmailDraft, EmailAddress, EmailSearchCriteria
+from app.infrastructure.connectors.gmail.oauth import GmailOAuthHandler
+from app.domain.entities.email import EmailSearchCriteria
 from tests.fixtures.gmail_fixtures import (
     SAMPLE_GMAIL_MESSAGE,
     SAMPLE_SEARCH_RESULTS,
@@ -13,23 +15,44 @@ from tests.fixtures.gmail_fixtures import (
     create_sample_draft
 )
 
+API_ERROR = HttpError(resp=MagicMock(status=500), content=b"Server error")
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_oauth_handler():
-    """Create mock OAuth handler."""
-    handler = MagicMock()
-    mock_creds = MagicMock()
-    handler.get_credentials.return_value = mock_creds
-    return handler
+    """Create mock OAuth handler (shared across the module, reset per test)."""
+    return Mock(spec=GmailOAuthHandler)
+
+
+@pytest.fixture(scope="module")
+def gmail_chain():
+    """
+    Build the mocked service.users().messages() call chain once.
+
+    Exposes the request objects returned by each messages() method, so tests
+    configure ``gmail_chain.send.execute`` directly and assert calls on
+    ``gmail_chain.messages.send``.
+    """
+    service = MagicMock()
+    messages = service.users.return_value.messages.return_value
+    return SimpleNamespace(
+        service=service,
+        messages=messages,
+        send=messages.send.return_value,
+        get=messages.get.return_value,
+        list=messages.list.return_value,
+        modify=messages.modify.return_value,
+        attachment_get=messages.attachments.return_value.get.return_value
+    )
 
 
-@pytest.fixture
-def mock_service():
-    """Create mock Gmail service."""
-    return MagicMock()
+@pytest.fixture(scope="module")
+def sample_draft():
+    """Sample email draft, built once; the client only reads it."""
+    return create_sample_draft()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def gmail_client(mock_oauth_handler):
     """Create Gmail client instance with mocked OAuth."""
     return GmailClient(
@@ -38,6 +61,22 @@ def gmail_client(mock_oauth_handler):
     )
 
 
+@pytest.fixture(autouse=True)
+def _reset_mocks(gmail_client, mock_oauth_handler, gmail_chain):
+    """Restore the shared client and mocks to a clean state for each test."""
+    mock_oauth_handler.get_credentials.return_value = Mock()
+    yield
+    gmail_client._service = None
+    gmail_client._user_email = None
+    mock_oauth_handler.reset_mock(return_value=True, side_effect=True)
+    gmail_chain.service.reset_mock()
+    for request in (
+        gmail_chain.send, gmail_chain.get, gmail_chain.list,
+        gmail_chain.modify, gmail_chain.attachment_get
+    ):
+        request.execute.reset_mock(return_value=True, side_effect=True)
+
+
 class TestGmailClient:
     """Test suite for GmailClient."""
 
@@ -83,53 +122,32 @@ class TestGmailClient:
         assert service1 == service2
         mock_build.assert_called_once()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @patch('app.infrastructure.connectors.gmail.client.GmailMessageMapper')
-    async def test_send_email_success(self, mock_mapper, gmail_client, mock_service):
+    async def test_send_email_success(self, mock_mapper, gmail_client, gmail_chain, sample_draft):
         """Test successful email sending."""
-        gmail_client._service = mock_service
+        gmail_client._service = gmail_chain.service
 
         # Mock mapper
         mock_mapper.from_email_draft.return_value = "base64_encoded_message"
 
         # Mock service response
-        mock_send = MagicMock()
-        mock_send.execute.return_value = {"id": "msg123"}
-        mock_service.users().messages().send.return_value = mock_send
+        gmail_chain.send.execute.return_value = {"id": "msg123"}
 
-        draft = create_sample_draft()
-        message_id = await gmail_client.send_email(draft)
+        message_id = await gmail_client.send_email(sample_draft)
 
         assert message_id == "msg123"
-        mock_mapper.from_email_draft.assert_called_once_with(draft)
-        mock_service.users().messages().send.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_send_email_failure(self, gmail_client, mock_service):
-        """Test email sending failure."""
-        gmail_client._service = mock_service
-
-        # Mock service to raise error
-        mock_service.users().messages().send.side_effect = HttpError(
-            resp=MagicMock(status=400),
-            content=b"Bad request"
-        )
-
-        draft = create_sample_draft()
-
-        with pytest.raises(Exception):
-            await gmail_client.send_email(draft)
+        mock_mapper.from_email_draft.assert_called_once_with(sample_draft)
+        gmail_chain.messages.send.assert_called_once()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @patch('app.infrastructure.connectors.gmail.client.GmailMessageMapper')
-    async def test_get_email_success(self, mock_mapper, gmail_client, mock_service):
+    async def test_get_email_success(self, mock_mapper, gmail_client, gmail_chain):
         """Test successful email retrieval."""
-        gmail_client._service = mock_service
+        gmail_client._service = gmail_chain.service
 
         # Mock service response
-        mock_get = MagicMock()
-        mock_get.execute.return_value = SAMPLE_GMAIL_MESSAGE
-        mock_service.users().messages().get.return_value = mock_get
+        gmail_chain.get.execute.return_value = SAMPLE_GMAIL_MESSAGE
 
         # Mock mapper
         mock_email = MagicMock()
@@ -138,42 +156,22 @@ class TestGmailClient:
         email = await gmail_client.get_email("msg123")
 
         assert email == mock_email
-        mock_service.users().messages().get.assert_called_once_with(
+        gmail_chain.messages.get.assert_called_once_with(
             userId='me',
             id='msg123',
             format='full'
         )
         mock_mapper.to_email_entity.assert_called_once_with(SAMPLE_GMAIL_MESSAGE)
 
-    @pytest.mark.asyncio
-    async def test_get_email_failure(self, gmail_client, mock_service):
-        """Test email retrieval failure."""
-        gmail_client._service = mock_service
-
-        # Mock service to raise error
-        mock_service.users().messages().get.side_effect = HttpError(
-            resp=MagicMock(status=404),
-            content=b"Not found"
-        )
-
-        with pytest.raises(Exception):
-            await gmail_client.get_email("nonexistent")
-
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @patch('app.infrastructure.connectors.gmail.client.GmailMessageMapper')
-    async def test_search_emails_success(self, mock_mapper, gmail_client, mock_service):
+    async def test_search_emails_success(self, mock_mapper, gmail_client, gmail_chain):
         """Test successful email search."""
-        gmail_client._service = mock_service
-
-        # Mock list response
-        mock_list = MagicMock()
-        mock_list.execute.return_value = SAMPLE_SEARCH_RESULTS
-        mock_service.users().messages().list.return_value = mock_list
+        gmail_client._service = gmail_chain.service
 
-        # Mock get responses
-        mock_get = MagicMock()
-        mock_get.execute.return_value = SAMPLE_GMAIL_MESSAGE
-        mock_service.users().messages().get.return_value = mock_get
+        # Mock list and get responses
+        gmail_chain.list.execute.return_value = SAMPLE_SEARCH_RESULTS
+        gmail_chain.get.execute.return_value = SAMPLE_GMAIL_MESSAGE
 
         # Mock mapper
         mock_email = MagicMock()
@@ -188,32 +186,28 @@ class TestGmailClient:
 
         assert len(emails) == 2
         assert all(e == mock_email for e in emails)
-        mock_service.users().messages().list.assert_called_once()
-        assert mock_service.users().messages().get.call_count == 2
+        gmail_chain.messages.list.assert_called_once()
+        assert gmail_chain.messages.get.call_count == 2
 
-    @pytest.mark.asyncio
-    async def test_search_emails_empty_results(self, gmail_client, mock_service):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_search_emails_empty_results(self, gmail_client, gmail_chain):
         """Test email search with no results."""
-        gmail_client._service = mock_service
+        gmail_client._service = gmail_chain.service
 
         # Mock empty response
-        mock_list = MagicMock()
-        mock_list.execute.return_value = EMPTY_SEARCH_RESULTS
-        mock_service.users().messages().list.return_value = mock_list
+        gmail_chain.list.execute.return_value = EMPTY_SEARCH_RESULTS
 
         criteria = EmailSearchCriteria(query="nonexistent")
         emails = await gmail_client.search_emails(criteria)
 
         assert len(emails) == 0
 
-    @pytest.mark.asyncio
-    async def test_search_emails_uses_criteria(self, gmail_client, mock_service):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_search_emails_uses_criteria(self, gmail_client, gmail_chain):
         """Test that search uses criteria correctly."""
-        gmail_client._service = mock_service
+        gmail_client._service = gmail_chain.service
 
-        mock_list = MagicMock()
-        mock_list.execute.return_value = EMPTY_SEARCH_RESULTS
-        mock_service.users().messages().list.return_value = mock_list
+        gmail_chain.list.execute.return_value = EMPTY_SEARCH_RESULTS
 
         criteria = EmailSearchCriteria(
             from_address="sender@example.com",
@@ -225,118 +219,78 @@ class TestGmailClient:
         await gmail_client.search_emails(criteria)
 
         # Verify query was built correctly
-        call_args = mock_service.users().messages().list.call_args
+        call_args = gmail_chain.messages.list.call_args
         assert call_args[1]['q'] == "from:sender@example.com subject:test is:unread"
         assert call_args[1]['maxResults'] == 25
 
-    @pytest.mark.asyncio
-    async def test_mark_as_read(self, gmail_client, mock_service):
-        """Test marking email as read."""
-        gmail_client._service = mock_service
-
-        mock_modify = MagicMock()
-        mock_modify.execute.return_value = {}
-        mock_service.users().messages().modify.return_value = mock_modify
-
-        await gmail_client.mark_as_read("msg123")
+    @pytest.mark.parametrize("method,args,body", [
+        ("mark_as_read", ("msg123",), {'removeLabelIds': ['UNREAD']}),
+        ("mark_as_unread", ("msg123",), {'addLabelIds': ['UNREAD']}),
+        ("add_label", ("msg123", "STARRED"), {'addLabelIds': ['STARRED']}),
+    ], ids=["mark_as_read", "mark_as_unread", "add_label"])
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_modify_labels(self, gmail_client, gmail_chain, method, args, body):
+        """Test label changes (read, unread, custom label) on an email."""
+        gmail_client._service = gmail_chain.service
 
-        mock_service.users().messages().modify.assert_called_once_with(
-            userId='me',
-            id='msg123',
-            body={'removeLabelIds': ['UNREAD']}
-        )
-
-    @pytest.mark.asyncio
-    async def test_mark_as_unread(self, gmail_client, mock_service):
-        """Test marking email as unread."""
-        gmail_client._service = mock_service
-
-        mock_modify = MagicMock()
-        mock_modify.execute.return_value = {}
-        mock_service.users().messages().modify.return_value = mock_modify
-
-        await gmail_client.mark_as_unread("msg123")
-
-        mock_service.users().messages().modify.assert_called_once_with(
-            userId='me',
-            id='msg123',
-            body={'addLabelIds': ['UNREAD']}
-        )
-
-    @pytest.mark.asyncio
-    async def test_add_label(self, gmail_client, mock_service):
-        """Test adding label to email."""
-        gmail_client._service = mock_service
-
-        mock_modify = MagicMock()
-        mock_modify.execute.return_value = {}
-        mock_service.users().messages().modify.return_value = mock_modify
+        gmail_chain.modify.execute.return_value = {}
 
-        await gmail_client.add_label("msg123", "STARRED")
+        await getattr(gmail_client, method)(*args)
 
-        mock_service.users().messages().modify.assert_called_once_with(
+        gmail_chain.messages.modify.assert_called_once_with(
             userId='me',
             id='msg123',
-            body={'addLabelIds': ['STARRED']}
+            body=body
         )
 
-    @pytest.mark.asyncio
-    async def test_get_attachment_success(self, gmail_client, mock_service):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_get_attachment_success(self, gmail_client, gmail_chain):
         """Test getting attachment."""
-        gmail_client._service = mock_service
+        gmail_client._service = gmail_chain.service
 
         # Mock attachment response (base64 encoded "test data")
-        mock_get = MagicMock()
-        mock_get.execute.return_value = {
+        gmail_chain.attachment_get.execute.return_value = {
             "data": "dGVzdCBkYXRh"  # base64 for "test data"
         }
-        mock_service.users().messages().attachments().get.return_value = mock_get
 
         data = await gmail_client.get_attachment("msg123", "att456")
 
         assert data == b"test data"
-        mock_service.users().messages().attachments().get.assert_called_once_with(
+        gmail_chain.messages.attachments().get.assert_called_once_with(
             userId='me',
             messageId='msg123',
             id='att456'
         )
 
-    @pytest.mark.asyncio
-    async def test_get_attachment_failure(self, gmail_client, mock_service):
-        """Test attachment retrieval failure."""
-        gmail_client._service = mock_service
+    @pytest.mark.parametrize("method,args,request_name", [
+        ("send_email", (create_sample_draft(),), "send"),
+        ("get_email", ("nonexistent",), "get"),
+        ("get_attachment", ("msg123", "att456"), "attachment_get"),
+    ], ids=["send_email", "get_email", "get_attachment"])
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_api_failure(self, gmail_client, gmail_chain, method, args, request_name):
+        """Test that Gmail API errors are raised to the caller."""
+        gmail_client._service = gmail_chain.service
 
-        mock_service.users().messages().attachments().get.side_effect = HttpError(
-            resp=MagicMock(status=404),
-            content=b"Not found"
-        )
+        getattr(gmail_chain, request_name).execute.side_effect = API_ERROR
 
         with pytest.raises(Exception):
-            await gmail_client.get_attachment("msg123", "att456")
+            await getattr(gmail_client, method)(*args)
 
-    @pytest.mark.asyncio
-    async def test_retry_on_failure(self, gmail_client, mock_service):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_retry_on_failure(self, gmail_client, gmail_chain, sample_draft):
         """Test that operations retry on failure."""
-        gmail_client._service = mock_service
+        gmail_client._service = gmail_chain.service
 
         # Mock service to fail twice then succeed
-        call_count = 0
-
-        def side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count < 3:
-                raise HttpError(resp=MagicMock(status=500), content=b"Server error")
-            mock_result = MagicMock()
-            mock_result.execute.return_value = {"id": "msg123"}
-            return mock_result
-
-        mock_service.users().messages().send.side_effect = side_effect
-
-        draft = create_sample_draft()
+        gmail_chain.send.execute.side_effect = [
+            API_ERROR,
+            API_ERROR,
+            {"id": "msg123"}
+        ]
 
         # Should succeed after retries
-        message_id = await gmail_client.send_email(draft)
+        message_id = await gmail_client.send_email(sample_draft)
 
         assert message_id == "msg123"
-        assert call_count == 3
+        assert gmail_chain.send.execute.call_count == 3
@@ -2,12 +2,58 @@
 Unit tests for Gmail OAuth handler.
 """
 import pytest
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from unittest.mock import Mock, MagicMock, patch, mock_open
-from google.oauth2.credentials import Credentials
+from typing import Optional
+from unittest.mock import MagicMock, patch
+from google.auth.exceptions import TransportError
 from app.infrastructure.connectors.gmail.oauth import GmailOAuthHandler
 
 
+@dataclass
+class FakeCredentials:
+    """Minimal stand-in for google.oauth2.credentials.Credentials."""
+    valid: bool = True
+    expired: bool = False
+    expiry: Optional[datetime] = None
+    refresh_token: Optional[str] = "refresh_token"
+    token_json: str = '{"token": "test_token"}'
+    refresh_calls: int = 0
+    refresh_error: Optional[Exception] = None
+
+    def refresh(self, request) -> None:
+        self.refresh_calls += 1
+        if self.refresh_error:
+            raise self.refresh_error
+        self.valid = True
+        self.expired = False
+        self.expiry = None
+
+    def to_json(self) -> str:
+        return self.token_json
+
+
+@pytest.fixture(scope="module")
+def shared_paths(tmp_path_factory):
+    """Credentials file and tokens dir shared by tests that never write to them."""
+    base = tmp_path_factory.mktemp("oauth")
+    credentials_file = base / "credentials.json"
+    credentials_file.write_text('{"client_id": "test", "client_secret": "secret"}')
+    return credentials_file, base / "tokens"
+
+
+@pytest.fixture(scope="module")
+def shared_oauth_handler(shared_paths):
+    """OAuth handler for read-only tests (no token loading or saving)."""
+    credentials_file, tokens_dir = shared_paths
+    return GmailOAuthHandler(
+        account_id="test@example.com",
+        credentials_file=credentials_file,
+        tokens_dir=tokens_dir
+    )
+
+
 class TestGmailOAuthHandler:
     """Test suite for GmailOAuthHandler."""
 
@@ -32,20 +78,23 @@ class TestGmailOAuthHandler:
             tokens_dir=temp_dir
         )
 
-    def test_init(self, oauth_handler, credentials_file, temp_dir):
+    def test_init(self, shared_oauth_handler, shared_paths):
         """Test OAuth handler initialization."""
-        assert oauth_handler.account_id == "test@example.com"
-        assert oauth_handler.credentials_file == credentials_file
-        assert oauth_handler.tokens_dir == temp_dir
-        assert oauth_handler._creds is None
+        credentials_file, temp_dir = shared_paths
+
+        assert shared_oauth_handler.account_id == "test@example.com"
+        assert shared_oauth_handler.credentials_file == credentials_file
+        assert shared_oauth_handler.tokens_dir == temp_dir
+        assert shared_oauth_handler._creds is None
 
-    def test_token_file_path(self, oauth_handler, temp_dir):
+    def test_token_file_path(self, shared_oauth_handler, shared_paths):
         """Test token file path generation."""
-        expected_path = temp_dir / "token_test_at_example_com.json"
-        assert oauth_handler.token_file == expected_path
+        expected_path = shared_paths[1] / "token_test_at_example_com.json"
+        assert shared_oauth_handler.token_file == expected_path
 
-    def test_token_file_path_sanitization(self, temp_dir, credentials_file):
+    def test_token_file_path_sanitization(self, shared_paths):
         """Test account ID sanitization in token filename."""
+        credentials_file, temp_dir = shared_paths
         handler = GmailOAuthHandler(
             account_id="user.name@example.co.uk",
             credentials_file=credentials_file,
@@ -64,8 +113,7 @@ class TestGmailOAuthHandler:
         token_file.write_text('{"token": "test_token"}')
 
         # Mock valid credentials
-        mock_creds = MagicMock()
-        mock_creds.valid = True
+        mock_creds = FakeCredentials()
         mock_creds_class.from_authorized_user_file.return_value = mock_creds
 
         credentials = oauth_handler.get_credentials()
@@ -73,6 +121,22 @@ class TestGmailOAuthHandler:
         assert credentials == mock_creds
         mock_creds_class.from_authorized_user_file.assert_called_once()
 
+    @patch('app.infrastructure.connectors.gmail.oauth.Credentials')
+    def test_get_credentials_cached(self, mock_creds_class, oauth_handler, temp_dir):
+        """Test that valid credentials are loaded from the token file only once."""
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        oauth_handler.token_file.write_text('{"token": "test_token"}')
+
+        mock_creds = FakeCredentials()
+        mock_creds_class.from_authorized_user_file.return_value = mock_creds
+
+        first = oauth_handler.get_credentials()
+        second = oauth_handler.get_credentials()
+
+        assert first is second is mock_creds
+        assert oauth_handler.is_authenticated is True
+        assert mock_creds_class.from_authorized_user_file.call_count == 1
+
     @patch('app.infrastructure.connectors.gmail.oauth.Credentials')
     @patch('app.infrastructure.connectors.gmail.oauth.Request')
     def test_get_credentials_refresh_expired(self, mock_request, mock_creds_class, oauth_handler, temp_dir):
@@ -82,39 +146,109 @@ class TestGmailOAuthHandler:
         temp_dir.mkdir(parents=True, exist_ok=True)
         token_file.write_text('{"token": "test_token"}')
 
-        # Mock expired credentials
-        mock_creds = MagicMock()
-        mock_creds.valid = False
-        mock_creds.expired = True
-        mock_creds.refresh_token = "refresh_token"
-        mock_creds.to_json.return_value = '{"token": "refreshed_token"}'
+        # Mock expired credentials; refresh() makes them valid again
+        mock_creds = FakeCredentials(valid=False, expired=True)
+        mock_creds_class.from_authorized_user_file.return_value = mock_creds
+
+        credentials = oauth_handler.get_credentials()
+
+        assert credentials == mock_creds
+        assert mock_creds.refresh_calls == 1
+
+    @patch('app.infrastructure.connectors.gmail.oauth.Credentials')
+    @patch('app.infrastructure.connectors.gmail.oauth.Request')
+    def test_get_credentials_refresh_before_expiry(self, mock_request, mock_creds_class, oauth_handler, temp_dir):
+        """Test that still-valid credentials close to expiry are refreshed early."""
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        oauth_handler.token_file.write_text('{"token": "test_token"}')
+
+        # Valid, but only 30 seconds of lifetime left
+        mock_creds = FakeCredentials(
+            expiry=datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(seconds=30)
+        )
+        mock_creds_class.from_authorized_user_file.return_value = mock_creds
+
+        credentials = oauth_handler.get_credentials()
+
+        assert credentials == mock_creds
+        assert mock_creds.refresh_calls == 1
+
+    @patch('app.infrastructure.connectors.gmail.oauth.Credentials')
+    @patch('app.infrastructure.connectors.gmail.oauth.Request')
+    def test_get_credentials_early_refresh_failure_keeps_valid_token(
+        self, mock_request, mock_creds_class, oauth_handler, temp_dir
+    ):
+        """Test that a failed early refresh returns the still-valid token unchanged."""
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        oauth_handler.token_file.write_text('{"token": "test_token"}')
+
+        expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(minutes=5)
+        mock_creds = FakeCredentials(
+            expiry=expiry,
+            refresh_error=TransportError("Network unreachable")
+        )
         mock_creds_class.from_authorized_user_file.return_value = mock_creds
 
-        # After refresh, credentials become valid
-        def refresh_side_effect(*args):
-            mock_creds.valid = True
+        credentials = oauth_handler.get_credentials()
 
-        mock_creds.refresh.side_effect = refresh_side_effect
+        assert credentials is mock_creds
+        assert credentials.expiry == expiry
+        assert oauth_handler.is_authenticated is True
+        assert mock_creds.refresh_calls == 2
+
+    @patch('app.infrastructure.connectors.gmail.oauth.Credentials')
+    @patch('app.infrastructure.connectors.gmail.oauth.Request')
+    def test_get_credentials_refresh_failure_expired_raises(
+        self, mock_request, mock_creds_class, oauth_handler, temp_dir
+    ):
+        """Test that a refresh error is raised once the token has expired."""
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        oauth_handler.token_file.write_text('{"token": "test_token"}')
+
+        mock_creds_class.from_authorized_user_file.return_value = FakeCredentials(
+            valid=False,
+            expired=True,
+            refresh_error=TransportError("Network unreachable")
+        )
+
+        with pytest.raises(TransportError):
+            oauth_handler.get_credentials()
+
+    @patch('google_auth_oauthlib.flow.InstalledAppFlow')
+    @patch('app.infrastructure.connectors.gmail.oauth.Credentials')
+    def test_get_credentials_near_expiry_without_refresh_token(
+        self, mock_creds_class, mock_flow_class, oauth_handler, temp_dir
+    ):
+        """Test that a valid token close to expiry is used as-is when it cannot be refreshed."""
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        oauth_handler.token_file.write_text('{"token": "test_token"}')
+
+        mock_creds = FakeCredentials(
+            expiry=datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(seconds=30),
+            refresh_token=None
+        )
+        mock_creds_class.from_authorized_user_file.return_value = mock_creds
 
         credentials = oauth_handler.get_credentials()
 
         assert credentials == mock_creds
-        mock_creds.refresh.assert_called_once()
+        assert oauth_handler.is_authenticated is True
+        assert mock_creds.refresh_calls == 0
+        mock_flow_class.from_client_secrets_file.assert_not_called()
 
-    @patch('app.infrastructure.connectors.gmail.oauth.InstalledAppFlow')
+    @patch('google_auth_oauthlib.flow.InstalledAppFlow')
     def test_get_credentials_new_auth_flow(self, mock_flow_class, oauth_handler, credentials_file):
         """Test new OAuth flow when no token exists."""
         # Mock flow
         mock_flow = MagicMock()
-        mock_creds = MagicMock()
-        mock_creds.valid = True
+        mock_creds = FakeCredentials()
         mock_flow.run_local_server.return_value = mock_creds
         mock_flow_class.from_client_secrets_file.return_value = mock_flow
 
-        with patch('builtins.open', mock_open()):
-            credentials = oauth_handler.get_credentials()
+        credentials = oauth_handler.get_credentials()
 
         assert credentials == mock_creds
+        assert oauth_handler.token_file.read_text() == mock_creds.to_json()
         mock_flow_class.from_client_secrets_file.assert_called_once()
         mock_flow.run_local_server.assert_called_once()
 
@@ -133,13 +267,24 @@ class TestGmailOAuthHandler:
         """Test saving credentials to file."""
         temp_dir.mkdir(parents=True, exist_ok=True)
 
-        mock_creds = MagicMock()
-        mock_creds.to_json.return_value = '{"token": "test"}'
-        oauth_handler._creds = mock_creds
+        oauth_handler._creds = FakeCredentials(token_json='{"token": "test"}')
 
-        with patch('builtins.open', mock_open()) as mock_file:
+        oauth_handler._save_credentials()
+
+        assert oauth_handler.token_file.read_text() == '{"token": "test"}'
+        # The temporary file was renamed over the token file
+        assert list(temp_dir.iterdir()) == [oauth_handler.token_file]
+
+    def test_save_credentials_unchanged_skips_write(self, oauth_handler, temp_dir):
+        """Test that an identical token on disk is not rewritten."""
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        oauth_handler.token_file.write_text('{"token": "test"}')
+        oauth_handler._creds = FakeCredentials(token_json='{"token": "test"}')
+
+        with patch('app.infrastructure.connectors.gmail.oauth.os.replace') as mock_replace:
             oauth_handler._save_credentials()
-            mock_file.assert_called_once()
+
+        mock_replace.assert_not_called()
 
     def test_revoke_credentials(self, oauth_handler, temp_dir):
         """Test revoking credentials."""
@@ -148,7 +293,7 @@ class TestGmailOAuthHandler:
         token_file = oauth_handler.token_file
         token_file.write_text('{"token": "test"}')
 
-        oauth_handler._creds = MagicMock()
+        oauth_handler._creds = FakeCredentials()
         oauth_handler.revoke_credentials()
 
         assert oauth_handler._creds is None
@@ -160,9 +305,7 @@ class TestGmailOAuthHandler:
         temp_dir.mkdir(parents=True, exist_ok=True)
         oauth_handler.token_file.write_text('{"token": "test"}')
 
-        mock_creds = MagicMock()
-        mock_creds.valid = True
-        mock_creds_class.from_authorized_user_file.return_value = mock_creds
+        mock_creds_class.from_authorized_user_file.return_value = FakeCredentials()
 
         assert oauth_handler.is_authenticated is True
 
@@ -221,9 +364,7 @@ class TestGmailOAuthHandler:
         assert not tokens_dir.exists()
 
         # Directory should be created when saving credentials
-        mock_creds = MagicMock()
-        mock_creds.to_json.return_value = '{"token": "test"}'
-        handler._creds = mock_creds
+        handler._creds = FakeCredentials(token_json='{"token": "test"}')
         handler._save_credentials()
 
         assert tokens_dir.exists()
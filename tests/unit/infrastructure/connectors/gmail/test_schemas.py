@@ -1,10 +1,14 @@
 """
 Unit tests for Gmail schemas and message mapping.
 """
+import base64
 import pytest
 from datetime import datetime
+from email.mime.text import MIMEText
+from email.utils import parsedate_to_datetime
+from unittest.mock import patch
 from app.infrastructure.connectors.gmail.schemas import GmailMessageMapper
-from app.domain.entities.email import EmailAddress, EmailDraft, EmailLabel
+from app.domain.entities.email import EmailAddress, EmailDraft
 from tests.fixtures.gmail_fixtures import (
     SAMPLE_GMAIL_MESSAGE,
     SAMPLE_GMAIL_MESSAGE_WITH_ATTACHMENT,
@@ -60,6 +64,24 @@ class TestGmailMessageMapper:
         assert email.is_read is True  # No UNREAD label
         assert "SENT" in email.labels
 
+    def test_to_email_entity_header_names_case_insensitive(self):
+        """Test that headers are matched regardless of name case."""
+        message = {
+            "id": "case123",
+            "payload": {
+                "headers": [
+                    {"name": "SUBJECT", "value": "Upper"},
+                    {"name": "from", "value": "sender@example.com"},
+                ],
+                "body": {}
+            }
+        }
+
+        email = GmailMessageMapper.to_email_entity(message)
+
+        assert email.subject == "Upper"
+        assert email.from_address.email == "sender@example.com"
+
     def test_parse_email_address_with_name(self):
         """Test parsing email address with name."""
         address = GmailMessageMapper._parse_email_address("John Doe <john@example.com>")
@@ -67,6 +89,13 @@ class TestGmailMessageMapper:
         assert address.email == "john@example.com"
         assert address.name == "John Doe"
 
+    def test_parse_email_address_with_quoted_name(self):
+        """Test parsing email address with a quoted name."""
+        address = GmailMessageMapper._parse_email_address('"Doe, John" <john@example.com>')
+
+        assert address.email == "john@example.com"
+        assert address.name == "Doe, John"
+
     def test_parse_email_address_without_name(self):
         """Test parsing email address without name."""
         address = GmailMessageMapper._parse_email_address("john@example.com")
@@ -113,6 +142,28 @@ class TestGmailMessageMapper:
         # Base64 encoded message should not contain newlines
         assert '\n' not in raw_message
 
+    @pytest.mark.parametrize("body_text", [
+        pytest.param("Test body\r\nSecond line", id="ascii"),
+        pytest.param("Hola, ¿qué tal?", id="utf8"),
+    ])
+    def test_from_email_draft_plain_matches_mime(self, body_text):
+        """Test the text-only fast path produces the same message as MIMEText."""
+        draft = EmailDraft(
+            to=[EmailAddress(email="recipient@example.com", name="Recipient")],
+            subject="Test Subject",
+            body_text=body_text,
+            reply_to_message_id="<previous@mail.gmail.com>"
+        )
+        expected = MIMEText(body_text, 'plain')
+        expected['To'] = "Recipient <recipient@example.com>"
+        expected['Subject'] = "Test Subject"
+        expected['In-Reply-To'] = "<previous@mail.gmail.com>"
+        expected['References'] = "<previous@mail.gmail.com>"
+
+        raw_message = GmailMessageMapper.from_email_draft(draft)
+
+        assert base64.urlsafe_b64decode(raw_message) == expected.as_bytes()
+
     def test_from_email_draft_with_html(self):
         """Test converting draft with HTML body."""
         draft = EmailDraft(
@@ -167,6 +218,46 @@ class TestGmailMessageMapper:
         assert body_text == "Hello, this is simple text."
         assert body_html is None
 
+    def test_extract_body_simple_html(self):
+        """Test extracting body from a single-part HTML message."""
+        payload = {
+            "mimeType": "text/html",
+            "body": {"data": base64.urlsafe_b64encode(b"<p>Hi</p>").decode()}
+        }
+
+        body_text, body_html = GmailMessageMapper._extract_body(payload)
+
+        assert body_text is None
+        assert body_html == "<p>Hi</p>"
+
+    def test_extract_body_decodes_only_returned_parts(self):
+        """Test that superseded and attachment bodies are not decoded."""
+        def encode(text):
+            return base64.urlsafe_b64encode(text.encode()).decode()
+
+        payload = {
+            "mimeType": "multipart/mixed",
+            "parts": [
+                {"mimeType": "text/plain", "body": {"data": "not base64!"}},
+                {"mimeType": "text/plain", "body": {"data": encode("Final text")}},
+                {"mimeType": "text/html", "body": {"data": encode("<p>Final</p>")}},
+                {
+                    "mimeType": "image/png",
+                    "filename": "logo.png",
+                    "body": {"data": "not base64!", "size": 11}
+                },
+            ]
+        }
+
+        with patch.object(
+            GmailMessageMapper, "_decode_body", wraps=GmailMessageMapper._decode_body
+        ) as decode_body:
+            body_text, body_html = GmailMessageMapper._extract_body(payload)
+
+        assert body_text == "Final text"
+        assert body_html == "<p>Final</p>"
+        assert decode_body.call_count == 2
+
     def test_extract_attachments(self):
         """Test extracting attachments from payload."""
         payload = SAMPLE_GMAIL_MESSAGE_WITH_ATTACHMENT["payload"]
@@ -192,6 +283,20 @@ class TestGmailMessageMapper:
         assert date.month == 1
         assert date.day == 20
 
+    @pytest.mark.parametrize("date_str", [
+        pytest.param("Mon, 20 Jan 2025 10:30:00 -0800", id="canonical"),
+        pytest.param("3 Feb 2025 08:05:09 +0530", id="no_weekday"),
+        pytest.param("Mon, 20 Jan 2025 10:30:00 -0000", id="unknown_zone"),
+        pytest.param("Mon, 20 Jan 2025 10:30:00 +0000 (UTC)", id="zone_comment"),
+    ])
+    def test_parse_date_matches_email_utils(self, date_str):
+        """Test the fast path and fallback agree with email.utils."""
+        date = GmailMessageMapper._parse_date(date_str)
+
+        expected = parsedate_to_datetime(date_str)
+        assert date == expected
+        assert date.utcoffset() == expected.utcoffset()
+
     def test_parse_date_invalid(self):
         """Test parsing invalid date string."""
         date = GmailMessageMapper._parse_date("invalid date")
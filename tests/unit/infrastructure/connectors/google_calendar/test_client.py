@@ -1,12 +1,16 @@
 """
 Unit tests for Google Calendar API client.
 """
+import asyncio
+import threading
+import time
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from datetime import datetime
 from googleapiclient.errors import HttpError
 
 from app.infrastructure.connectors.google_calendar.client import GoogleCalendarClient
+from app.infrastructure.connectors.google_calendar.oauth import GoogleCalendarOAuthHandler
 from app.domain.entities.calendar_event import (
     CalendarEventDraft,
     EventDateTime,
@@ -16,12 +20,26 @@ from app.domain.entities.calendar_event import (
 )
 
 
+@pytest.fixture(scope="module")
+def _patched_mapper():
+    """Patch GoogleCalendarMapper once per module; the client imports it on each call."""
+    with patch('app.infrastructure.connectors.google_calendar.schemas.GoogleCalendarMapper') as mapper:
+        yield mapper
+
+
+@pytest.fixture(autouse=True)
+def mock_mapper(_patched_mapper):
+    """Patched GoogleCalendarMapper, reset after each test."""
+    _patched_mapper.from_event_draft.return_value = {'summary': 'Test Event'}
+    yield _patched_mapper
+    _patched_mapper.reset_mock(return_value=True, side_effect=True)
+
+
 @pytest.fixture
 def mock_oauth_handler():
     """Create mock OAuth handler."""
-    handler = MagicMock()
-    mock_creds = MagicMock()
-    handler.get_credentials.return_value = mock_creds
+    handler = Mock(spec=GoogleCalendarOAuthHandler)
+    handler.get_credentials.return_value = Mock()
     return handler
 
 
@@ -119,34 +137,55 @@ class TestGoogleCalendarClient:
 
         assert service == mock_service
         mock_oauth_handler.get_credentials.assert_called_once()
-        mock_build.assert_called_once_with('calendar', 'v3', credentials=mock_oauth_handler.get_credentials())
+        mock_build.assert_called_once_with(
+            'calendar',
+            'v3',
+            credentials=mock_oauth_handler.get_credentials(),
+            cache_discovery=False,
+            static_discovery=True
+        )
+
+    @patch('app.infrastructure.connectors.google_calendar.client.build')
+    def test_get_service_reuses_existing(self, mock_build, google_calendar_client, mock_oauth_handler):
+        """Test that _get_service builds the service once and reuses it."""
+        mock_build.return_value = MagicMock()
+
+        service1 = google_calendar_client._get_service()
+        service2 = google_calendar_client._get_service()
+
+        assert service1 is service2
+        mock_build.assert_called_once()
+        mock_oauth_handler.get_credentials.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch('app.infrastructure.connectors.google_calendar.schemas.GoogleCalendarMapper')
     async def test_create_event_success(self, mock_mapper, google_calendar_client, mock_service, sample_event_draft):
         """Test successful event creation."""
         google_calendar_client._service = mock_service
-
-        # Mock mapper
-        mock_mapper.from_event_draft.return_value = {'summary': 'Test Event'}
+        events_mock = mock_service.events.return_value
 
         # Mock service response
         mock_insert = MagicMock()
         mock_insert.execute.return_value = {'id': 'event123'}
-        mock_service.events().insert.return_value = mock_insert
+        events_mock.insert.return_value = mock_insert
 
         event_id = await google_calendar_client.create_event('primary', sample_event_draft)
 
         assert event_id == 'event123'
         mock_mapper.from_event_draft.assert_called_once_with(sample_event_draft)
-        mock_service.events().insert.assert_called_once()
+        mock_service.events.assert_called_once_with()
+        events_mock.insert.assert_called_once_with(
+            calendarId='primary',
+            body={'summary': 'Test Event'},
+            sendUpdates='all'
+        )
 
     @pytest.mark.asyncio
     async def test_create_event_failure(self, google_calendar_client, mock_service, sample_event_draft):
         """Test event creation failure."""
         google_calendar_client._service = mock_service
+        events_mock = mock_service.events.return_value
 
-        mock_service.events().insert.side_effect = HttpError(
+        events_mock.insert.side_effect = HttpError(
             resp=MagicMock(status=400),
             content=b"Bad request"
         )
@@ -155,15 +194,15 @@ class TestGoogleCalendarClient:
             await google_calendar_client.create_event('primary', sample_event_draft)
 
     @pytest.mark.asyncio
-    @patch('app.infrastructure.connectors.google_calendar.schemas.GoogleCalendarMapper')
     async def test_get_event_success(self, mock_mapper, google_calendar_client, mock_service, sample_api_event):
         """Test successful event retrieval."""
         google_calendar_client._service = mock_service
+        events_mock = mock_service.events.return_value
 
         # Mock service response
         mock_get = MagicMock()
         mock_get.execute.return_value = sample_api_event
-        mock_service.events().get.return_value = mock_get
+        events_mock.get.return_value = mock_get
 
         # Mock mapper
         mock_event = MagicMock()
@@ -172,23 +211,24 @@ class TestGoogleCalendarClient:
         event = await google_calendar_client.get_event('primary', 'event123')
 
         assert event == mock_event
-        mock_service.events().get.assert_called_once_with(
+        mock_service.events.assert_called_once_with()
+        events_mock.get.assert_called_once_with(
             calendarId='primary',
             eventId='event123'
         )
 
     @pytest.mark.asyncio
-    @patch('app.infrastructure.connectors.google_calendar.schemas.GoogleCalendarMapper')
     async def test_list_events_success(self, mock_mapper, google_calendar_client, mock_service, sample_api_event):
         """Test successful event listing."""
         google_calendar_client._service = mock_service
+        events_mock = mock_service.events.return_value
 
         # Mock list response
         mock_list = MagicMock()
         mock_list.execute.return_value = {
             'items': [sample_api_event, sample_api_event]
         }
-        mock_service.events().list.return_value = mock_list
+        events_mock.list.return_value = mock_list
 
         # Mock mapper
         mock_event = MagicMock()
@@ -205,16 +245,44 @@ class TestGoogleCalendarClient:
 
         assert len(events) == 2
         assert all(e == mock_event for e in events)
-        mock_service.events().list.assert_called_once()
+        mock_service.events.assert_called_once_with()
+        events_mock.list.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_list_events_follows_page_tokens(self, google_calendar_client, mock_service, sample_api_event):
+        """Test that further pages are requested until max_results is reached."""
+        google_calendar_client._service = mock_service
+        events_mock = mock_service.events.return_value
+
+        first_page = MagicMock()
+        first_page.execute.return_value = {
+            'items': [sample_api_event, sample_api_event],
+            'nextPageToken': 'page2'
+        }
+        second_page = MagicMock()
+        second_page.execute.return_value = {'items': [sample_api_event]}
+        events_mock.list.side_effect = [first_page, second_page]
+
+        criteria = EventSearchCriteria(calendar_id='primary', max_results=5)
+        events = await google_calendar_client.list_events(criteria)
+
+        assert len(events) == 3
+        first_call, second_call = events_mock.list.call_args_list
+        assert first_call.kwargs['maxResults'] == 5
+        assert 'pageToken' not in first_call.kwargs
+        assert second_call.kwargs['maxResults'] == 3
+        assert second_call.kwargs['pageToken'] == 'page2'
+        assert 'items(' in second_call.kwargs['fields']
 
     @pytest.mark.asyncio
     async def test_list_events_empty(self, google_calendar_client, mock_service):
         """Test event listing with no results."""
         google_calendar_client._service = mock_service
+        events_mock = mock_service.events.return_value
 
         mock_list = MagicMock()
         mock_list.execute.return_value = {'items': []}
-        mock_service.events().list.return_value = mock_list
+        events_mock.list.return_value = mock_list
 
         criteria = EventSearchCriteria(calendar_id='primary')
         events = await google_calendar_client.list_events(criteria)
@@ -225,21 +293,22 @@ class TestGoogleCalendarClient:
     async def test_delete_event_success(self, google_calendar_client, mock_service):
         """Test successful event deletion."""
         google_calendar_client._service = mock_service
+        events_mock = mock_service.events.return_value
 
         mock_delete = MagicMock()
         mock_delete.execute.return_value = {}
-        mock_service.events().delete.return_value = mock_delete
+        events_mock.delete.return_value = mock_delete
 
         await google_calendar_client.delete_event('primary', 'event123')
 
-        mock_service.events().delete.assert_called_once_with(
+        mock_service.events.assert_called_once_with()
+        events_mock.delete.assert_called_once_with(
             calendarId='primary',
             eventId='event123',
             sendUpdates='all'
         )
 
     @pytest.mark.asyncio
-    @patch('app.infrastructure.connectors.google_calendar.schemas.GoogleCalendarMapper')
     async def test_list_calendars_success(self, mock_mapper, google_calendar_client, mock_service, sample_api_calendar):
         """Test successful calendar listing."""
         google_calendar_client._service = mock_service
@@ -286,3 +355,36 @@ class TestGoogleCalendarClient:
 
         assert 'calendars' in result
         mock_service.freebusy().query.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_requests_run_serialized_off_event_loop(
+        self, mock_mapper, google_calendar_client, mock_service, sample_api_event
+    ):
+        """Test concurrent calls execute in worker threads, one at a time on the shared transport."""
+        google_calendar_client._service = mock_service
+        loop_thread = threading.get_ident()
+        active = 0
+        max_active = 0
+        execute_threads = []
+        counter_lock = threading.Lock()
+
+        def execute():
+            nonlocal active, max_active
+            with counter_lock:
+                active += 1
+                max_active = max(max_active, active)
+                execute_threads.append(threading.get_ident())
+            time.sleep(0.01)
+            with counter_lock:
+                active -= 1
+            return sample_api_event
+
+        mock_service.events.return_value.get.return_value.execute.side_effect = execute
+
+        await asyncio.gather(*(
+            google_calendar_client.get_event('primary', f'event{i}') for i in range(5)
+        ))
+
+        assert len(execute_threads) == 5
+        assert loop_thread not in execute_threads
+        assert max_active == 1
@@ -2,10 +2,10 @@
 Unit tests for Google Calendar schemas/mappers.
 """
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 from app.infrastructure.connectors.google_calendar.schemas import GoogleCalendarMapper
-from app.domain.entities.calendar import Calendar, CalendarProvider
+from app.domain.entities.calendar import CalendarProvider
 from app.domain.entities.calendar_event import (
     CalendarEvent,
     CalendarEventDraft,
@@ -16,6 +16,43 @@ from app.domain.entities.calendar_event import (
     AttendeeResponseStatus
 )
 
+# Drafts are built once at import; the mapper only reads them
+EVENT_START = EventDateTime(datetime=datetime(2026, 1, 15, 10, 0, 0), timezone='UTC')
+EVENT_END = EventDateTime(datetime=datetime(2026, 1, 15, 11, 0, 0), timezone='UTC')
+
+FULL_EVENT_DRAFT = CalendarEventDraft(
+    summary='Test Event',
+    start=EVENT_START,
+    end=EVENT_END,
+    description='Test description',
+    location='Test location',
+    attendees=[
+        CalendarAttendee(
+            email='attendee@example.com',
+            display_name='Attendee',
+            optional=False
+        )
+    ],
+    reminders=[
+        EventReminder(method='popup', minutes=30)
+    ],
+    recurrence=EventRecurrence(rrule='RRULE:FREQ=WEEKLY'),
+    color_id='1',
+    visibility='private'
+)
+
+ALL_DAY_EVENT_DRAFT = CalendarEventDraft(
+    summary='All Day Event',
+    start=EventDateTime(date='2026-01-15'),
+    end=EventDateTime(date='2026-01-16')
+)
+
+MINIMAL_EVENT_DRAFT = CalendarEventDraft(
+    summary='Minimal Event',
+    start=EVENT_START,
+    end=EVENT_END
+)
+
 
 class TestGoogleCalendarMapper:
     """Test suite for GoogleCalendarMapper."""
@@ -79,19 +116,33 @@ class TestGoogleCalendarMapper:
 
         event = GoogleCalendarMapper.to_event_entity(api_data)
 
-        assert event.id == 'event123'
-        assert event.summary == 'Test Event'
-        assert event.description == 'Test description'
-        assert event.location == 'Test location'
-        assert event.creator == 'creator@example.com'
-        assert event.organizer == 'organizer@example.com'
-        assert len(event.attendees) == 1
-        assert event.attendees[0].email == 'attendee1@example.com'
-        assert event.attendees[0].response_status == AttendeeResponseStatus.ACCEPTED
-        assert len(event.reminders) == 2
-        assert event.recurrence is not None
-        assert event.recurrence.rrule == 'RRULE:FREQ=WEEKLY;BYDAY=MO'
-        assert event.html_link == 'https://calendar.google.com/event123'
+        # One structural comparison; pytest reports the differing fields
+        assert event == CalendarEvent(
+            id='event123',
+            summary='Test Event',
+            start=EventDateTime(datetime=datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)),
+            end=EventDateTime(datetime=datetime(2026, 1, 15, 11, 0, tzinfo=timezone.utc)),
+            description='Test description',
+            location='Test location',
+            creator='creator@example.com',
+            organizer='organizer@example.com',
+            attendees=[
+                CalendarAttendee(
+                    email='attendee1@example.com',
+                    display_name='Attendee One',
+                    response_status=AttendeeResponseStatus.ACCEPTED
+                )
+            ],
+            reminders=[
+                EventReminder(method='popup', minutes=30),
+                EventReminder(method='email', minutes=60)
+            ],
+            recurrence=EventRecurrence(rrule='RRULE:FREQ=WEEKLY;BYDAY=MO'),
+            status='confirmed',
+            created=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            updated=datetime(2026, 1, 2, tzinfo=timezone.utc),
+            html_link='https://calendar.google.com/event123'
+        )
 
     def test_to_event_entity_all_day(self):
         """Test converting all-day event to domain entity."""
@@ -113,28 +164,7 @@ class TestGoogleCalendarMapper:
 
     def test_from_event_draft_full(self):
         """Test converting domain draft to API format with all fields."""
-        draft = CalendarEventDraft(
-            summary='Test Event',
-            start=EventDateTime(datetime=datetime(2026, 1, 15, 10, 0, 0), timezone='UTC'),
-            end=EventDateTime(datetime=datetime(2026, 1, 15, 11, 0, 0), timezone='UTC'),
-            description='Test description',
-            location='Test location',
-            attendees=[
-                CalendarAttendee(
-                    email='attendee@example.com',
-                    display_name='Attendee',
-                    optional=False
-                )
-            ],
-            reminders=[
-                EventReminder(method='popup', minutes=30)
-            ],
-            recurrence=EventRecurrence(rrule='RRULE:FREQ=WEEKLY'),
-            color_id='1',
-            visibility='private'
-        )
-
-        api_data = GoogleCalendarMapper.from_event_draft(draft)
+        api_data = GoogleCalendarMapper.from_event_draft(FULL_EVENT_DRAFT)
 
         assert api_data['summary'] == 'Test Event'
         assert api_data['description'] == 'Test description'
@@ -151,13 +181,7 @@ class TestGoogleCalendarMapper:
 
     def test_from_event_draft_all_day(self):
         """Test converting all-day draft to API format."""
-        draft = CalendarEventDraft(
-            summary='All Day Event',
-            start=EventDateTime(date='2026-01-15'),
-            end=EventDateTime(date='2026-01-16')
-        )
-
-        api_data = GoogleCalendarMapper.from_event_draft(draft)
+        api_data = GoogleCalendarMapper.from_event_draft(ALL_DAY_EVENT_DRAFT)
 
         assert api_data['summary'] == 'All Day Event'
         assert 'date' in api_data['start']
@@ -167,13 +191,7 @@ class TestGoogleCalendarMapper:
 
     def test_from_event_draft_minimal(self):
         """Test converting minimal draft to API format."""
-        draft = CalendarEventDraft(
-            summary='Minimal Event',
-            start=EventDateTime(datetime=datetime(2026, 1, 15, 10, 0, 0)),
-            end=EventDateTime(datetime=datetime(2026, 1, 15, 11, 0, 0))
-        )
-
-        api_data = GoogleCalendarMapper.from_event_draft(draft)
+        api_data = GoogleCalendarMapper.from_event_draft(MINIMAL_EVENT_DRAFT)
 
         assert api_data['summary'] == 'Minimal Event'
         assert 'start' in api_data
@@ -213,51 +231,47 @@ class TestGoogleCalendarMapper:
         assert attendee.response_status == AttendeeResponseStatus.NEEDS_ACTION
         assert attendee.optional is False
 
-    def test_parse_event_datetime_with_datetime(self):
-        """Test parsing datetime with time."""
-        api_data = {
-            'dateTime': '2026-01-15T10:00:00-05:00',
-            'timeZone': 'America/New_York'
-        }
-
-        event_dt = GoogleCalendarMapper._parse_event_datetime(api_data)
-
-        assert event_dt.datetime is not None
-        assert event_dt.timezone == 'America/New_York'
-        assert event_dt.date is None
-
-    def test_parse_event_datetime_with_date(self):
-        """Test parsing date-only (all-day event)."""
-        api_data = {
-            'date': '2026-01-15',
-            'timeZone': 'UTC'
-        }
-
-        event_dt = GoogleCalendarMapper._parse_event_datetime(api_data)
-
-        assert event_dt.date == '2026-01-15'
-        assert event_dt.datetime is None
-        assert event_dt.timezone == 'UTC'
-
-    def test_format_event_datetime_with_datetime(self):
-        """Test formatting datetime."""
-        event_dt = EventDateTime(
-            datetime=datetime(2026, 1, 15, 10, 0, 0),
-            timezone='America/New_York'
-        )
-
-        api_data = GoogleCalendarMapper._format_event_datetime(event_dt)
-
-        assert 'dateTime' in api_data
-        assert 'timeZone' in api_data
-        assert api_data['timeZone'] == 'America/New_York'
-
-    def test_format_event_datetime_with_date(self):
-        """Test formatting date-only."""
-        event_dt = EventDateTime(date='2026-01-15')
-
+    @pytest.mark.parametrize("api_data,event_dt,formatted", [
+        pytest.param(
+            {'dateTime': '2026-01-15T10:00:00-05:00', 'timeZone': 'America/New_York'},
+            EventDateTime(
+                datetime=datetime(2026, 1, 15, 10, 0, 0, tzinfo=timezone(timedelta(hours=-5))),
+                timezone='America/New_York'
+            ),
+            {'dateTime': '2026-01-15T10:00:00-05:00', 'timeZone': 'America/New_York'},
+            id="datetime"
+        ),
+        pytest.param(
+            {'date': '2026-01-15', 'timeZone': 'UTC'},
+            EventDateTime(date='2026-01-15', timezone='UTC'),
+            {'date': '2026-01-15'},  # All-day events carry no time zone
+            id="date"
+        ),
+    ])
+    def test_event_datetime_round_trip(self, api_data, event_dt, formatted):
+        """Test parsing API date/time data and formatting it back."""
+        parsed = GoogleCalendarMapper._parse_event_datetime(api_data)
+
+        assert parsed == event_dt
+        assert GoogleCalendarMapper._format_event_datetime(parsed) == formatted
+
+    @pytest.mark.parametrize("event_dt", [
+        pytest.param(EVENT_START, id="naive"),
+        pytest.param(
+            EventDateTime(datetime=datetime(2026, 3, 29, 1, 30, tzinfo=timezone.utc)),
+            id="utc"
+        ),
+        pytest.param(
+            EventDateTime(
+                datetime=datetime(2026, 12, 31, 23, 59, 59, tzinfo=timezone(timedelta(hours=5, minutes=30))),
+                timezone='Asia/Kolkata'
+            ),
+            id="offset"
+        ),
+        pytest.param(EventDateTime(date='2026-02-28'), id="date"),
+    ])
+    def test_event_datetime_format_round_trip(self, event_dt):
+        """Test formatting an EventDateTime and parsing it back gives the same value."""
         api_data = GoogleCalendarMapper._format_event_datetime(event_dt)
 
-        assert 'date' in api_data
-        assert api_data['date'] == '2026-01-15'
-        assert 'dateTime' not in api_data
+        assert GoogleCalendarMapper._parse_event_datetime(api_data) == event_dt
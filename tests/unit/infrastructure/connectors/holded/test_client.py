@@ -2,49 +2,189 @@
 Unit tests for Holded client.
 """
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
-from datetime import date
+from dataclasses import dataclass
+from unittest.mock import AsyncMock, patch
 
 from app.infrastructure.connectors.holded.client import HoldedClient
 from app.domain.entities.invoice import InvoiceDraft, InvoiceItem
 from app.domain.entities.contact import ContactDraft
+from tests.fixtures.assertions import assert_attrs
 
+INVOICE_DRAFT = InvoiceDraft(
+    contact_id="contact123",
+    items=[
+        InvoiceItem(name="Test Item", quantity=1, price=100.0, tax_rate=21.0)
+    ],
+    doc_type="invoice"
+)
 
-@pytest.fixture
+CONTACT_DRAFT = ContactDraft(
+    name="Test Customer",
+    email="test@example.com",
+    type="client"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class FakeSettings:
+    """Stand-in for the settings fields HoldedClient reads."""
+    holded_api_key: str = "test_api_key"
+    holded_api_base_url: str = "https://api.holded.com"
+
+
+@pytest.fixture(scope="module")
 def holded_client():
-    """Create a Holded client with mocked API key."""
-    with patch('app.infrastructure.connectors.holded.client.settings') as mock_settings:
-        mock_settings.holded_api_key = "test_api_key"
-        mock_settings.holded_api_base_url = "https://api.holded.com"
-        return HoldedClient()
+    """
+    Create a Holded client with mocked API key, shared across the module.
 
+    The client only reads settings in __init__ and keeps no per-request
+    state; its _request method is patched by the _patched_request fixture.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr('app.infrastructure.connectors.holded.client.settings', FakeSettings())
+        client = HoldedClient()
+    return client
 
-@pytest.mark.asyncio
-async def test_create_invoice_success(holded_client):
-    """Test creating an invoice successfully."""
-    # Arrange
-    draft = InvoiceDraft(
-        contact_id="contact123",
-        items=[
-            InvoiceItem(name="Test Item", quantity=1, price=100.0, tax_rate=21.0)
+
+@pytest.fixture(scope="module")
+def _patched_request(holded_client):
+    """Patch _request on the shared client once per module."""
+    with patch.object(holded_client, '_request', new_callable=AsyncMock) as mock_request:
+        yield mock_request
+
+
+@pytest.fixture
+def mock_request(_patched_request):
+    """Patched HoldedClient._request, reset after each test."""
+    yield _patched_request
+    _patched_request.reset_mock(return_value=True, side_effect=True)
+
+
+# (client method, kwargs, _request response, expected ID)
+CREATE_CASES = [
+    pytest.param(
+        "create_invoice",
+        {"draft": INVOICE_DRAFT},
+        {"id": "invoice123"},
+        "invoice123",
+        id="invoice"
+    ),
+    pytest.param(
+        "create_contact",
+        {"draft": CONTACT_DRAFT},
+        {"id": "contact123"},
+        "contact123",
+        id="contact"
+    ),
+]
+
+# (client method, kwargs, _request response, expected attributes per entity)
+LIST_CASES = [
+    pytest.param(
+        "list_contacts",
+        {"contact_type": "client"},
+        [
+            {
+                "id": "contact1",
+                "name": "Customer 1",
+                "type": "client",
+                "email": "customer1@example.com"
+            },
+            {
+                "id": "contact2",
+                "name": "Customer 2",
+                "type": "client",
+                "email": "customer2@example.com"
+            }
+        ],
+        [{"name": "Customer 1"}, {"name": "Customer 2"}],
+        id="contacts"
+    ),
+    pytest.param(
+        "list_products",
+        {},
+        [
+            {
+                "id": "product1",
+                "name": "Product 1",
+                "price": 100.0,
+                "tax": 21.0,
+                "type": "product",
+                "active": True
+            }
         ],
-        doc_type="invoice"
-    )
+        [{"name": "Product 1", "price": 100.0}],
+        id="products"
+    ),
+    pytest.param(
+        "list_treasury_accounts",
+        {},
+        [
+            {
+                "id": "treasury1",
+                "name": "Main Bank Account",
+                "iban": "ES1234567890",
+                "bankName": "Test Bank",
+                "balance": 5000.0,
+                "type": "bank",
+                "active": True
+            }
+        ],
+        [{"name": "Main Bank Account", "balance": 5000.0}],
+        id="treasury_accounts"
+    ),
+    pytest.param(
+        "list_expense_accounts",
+        {},
+        [
+            {
+                "id": "expense1",
+                "name": "Office Supplies",
+                "accountNumber": "6000",
+                "code": "6000",
+                "balance": 2500.0,
+                "active": True
+            }
+        ],
+        [{"name": "Office Supplies", "balance": 2500.0}],
+        id="expense_accounts"
+    ),
+    pytest.param(
+        "list_income_accounts",
+        {},
+        [
+            {
+                "id": "income1",
+                "name": "Sales Revenue",
+                "accountNumber": "7000",
+                "code": "7000",
+                "balance": 15000.0,
+                "active": True
+            }
+        ],
+        [{"name": "Sales Revenue", "balance": 15000.0}],
+        id="income_accounts"
+    ),
+]
 
-    mock_response = {"id": "invoice123"}
+
+@pytest.mark.parametrize("method,kwargs,response,expected_id", CREATE_CASES)
+@pytest.mark.asyncio(loop_scope="session")
+async def test_create_success(holded_client, mock_request, method, kwargs, response, expected_id):
+    """Test creating a resource returns the new ID."""
+    # Arrange
+    mock_request.return_value = response
 
     # Act
-    with patch.object(holded_client, '_request', new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = mock_response
-        result = await holded_client.create_invoice(draft)
+    result = await getattr(holded_client, method)(**kwargs)
 
     # Assert
-    assert result == "invoice123"
+    assert result == expected_id
     mock_request.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_get_invoice_success(holded_client):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_invoice_success(holded_client, mock_request):
     """Test getting an invoice successfully."""
     # Arrange
     invoice_id = "invoice123"
@@ -61,11 +201,10 @@ async def test_get_invoice_success(holded_client):
         "paid": False,
         "status": "draft"
     }
+    mock_request.return_value = mock_response
 
     # Act
-    with patch.object(holded_client, '_request', new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = mock_response
-        result = await holded_client.get_invoice(invoice_id)
+    result = await holded_client.get_invoice(invoice_id)
 
     # Assert
     assert result.id == invoice_id
@@ -73,158 +212,18 @@ async def test_get_invoice_success(holded_client):
     assert result.total == 121.0
 
 
-@pytest.mark.asyncio
-async def test_create_contact_success(holded_client):
-    """Test creating a contact successfully."""
+@pytest.mark.parametrize("method,kwargs,response,expected_attrs", LIST_CASES)
+@pytest.mark.asyncio(loop_scope="session")
+async def test_list_success(holded_client, mock_request, method, kwargs, response, expected_attrs):
+    """Test listing resources maps every returned item."""
     # Arrange
-    draft = ContactDraft(
-        name="Test Customer",
-        email="test@example.com",
-        type="client"
-    )
-
-    mock_response = {"id": "contact123"}
+    mock_request.return_value = response
 
     # Act
-    with patch.object(holded_client, '_request', new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = mock_response
-        result = await holded_client.create_contact(draft)
+    result = await getattr(holded_client, method)(**kwargs)
 
     # Assert
-    assert result == "contact123"
+    assert len(result) == len(expected_attrs)
+    for entity, expected in zip(result, expected_attrs):
+        assert_attrs(entity, expected)
     mock_request.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_list_contacts_success(holded_client):
-    """Test listing contacts successfully."""
-    # Arrange
-    mock_response = [
-        {
-            "id": "contact1",
-            "name": "Customer 1",
-            "type": "client",
-            "email": "customer1@example.com"
-        },
-        {
-            "id": "contact2",
-            "name": "Customer 2",
-            "type": "client",
-            "email": "customer2@example.com"
-        }
-    ]
-
-    # Act
-    with patch.object(holded_client, '_request', new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = mock_response
-        result = await holded_client.list_contacts(contact_type="client")
-
-    # Assert
-    assert len(result) == 2
-    assert result[0].name == "Customer 1"
-    assert result[1].name == "Customer 2"
-
-
-@pytest.mark.asyncio
-async def test_list_products_success(holded_client):
-    """Test listing products successfully."""
-    # Arrange
-    mock_response = [
-        {
-            "id": "product1",
-            "name": "Product 1",
-            "price": 100.0,
-            "tax": 21.0,
-            "type": "product",
-            "active": True
-        }
-    ]
-
-    # Act
-    with patch.object(holded_client, '_request', new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = mock_response
-        result = await holded_client.list_products()
-
-    # Assert
-    assert len(result) == 1
-    assert result[0].name == "Product 1"
-    assert result[0].price == 100.0
-
-
-@pytest.mark.asyncio
-async def test_list_treasury_accounts_success(holded_client):
-    """Test listing treasury accounts successfully."""
-    # Arrange
-    mock_response = [
-        {
-            "id": "treasury1",
-            "name": "Main Bank Account",
-            "iban": "ES1234567890",
-            "bankName": "Test Bank",
-            "balance": 5000.0,
-            "type": "bank",
-            "active": True
-        }
-    ]
-
-    # Act
-    with patch.object(holded_client, '_request', new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = mock_response
-        result = await holded_client.list_treasury_accounts()
-
-    # Assert
-    assert len(result) == 1
-    assert result[0].name == "Main Bank Account"
-    assert result[0].balance == 5000.0
-
-
-@pytest.mark.asyncio
-async def test_list_expense_accounts_success(holded_client):
-    """Test listing expense accounts successfully."""
-    # Arrange
-    mock_response = [
-        {
-            "id": "expense1",
-            "name": "Office Supplies",
-            "accountNumber": "6000",
-            "code": "6000",
-            "balance": 2500.0,
-            "active": True
-        }
-    ]
-
-    # Act
-    with patch.object(holded_client, '_request', new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = mock_response
-        result = await holded_client.list_expense_accounts()
-
-    # Assert
-    assert len(result) == 1
-    assert result[0].name == "Office Supplies"
-    assert result[0].balance == 2500.0
-
-
-@pytest.mark.asyncio
-async def test_list_income_accounts_success(holded_client):
-    """Test listing income accounts successfully."""
-    # Arrange
-    mock_response = [
-        {
-            "id": "income1",
-            "name": "Sales Revenue",
-            "accountNumber": "7000",
-            "code": "7000",
-            "balance": 15000.0,
-            "active": True
-        }
-    ]
-
-    # Act
-    with patch.object(holded_client, '_request', new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = mock_response
-        result = await holded_client.list_income_accounts()
-
-    # Assert
-    assert len(result) == 1
-    assert result[0].name == "Sales Revenue"
-    assert result[0].balance == 15000.0
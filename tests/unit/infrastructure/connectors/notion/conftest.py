@@ -0,0 +1,86 @@
+"""
+Shared Notion API response fixtures for the connector tests.
+"""
+import pytest
+
+
+@pytest.fixture(scope="module")
+def sample_page_response():
+    """Page as returned by the Notion API (read-only, shared across the module)."""
+    return {
+        "object": "page",
+        "id": "page_123",
+        "properties": {
+            "title": {
+                "type": "title",
+                "title": [{"plain_text": "Test Page"}]
+            }
+        },
+        "parent": {"type": "page_id", "page_id": "parent_123"},
+        "url": "https://notion.so/page_123",
+        "archived": False,
+        "created_time": "2025-01-01T00:00:00.000Z",
+        "last_edited_time": "2025-01-01T12:00:00.000Z",
+        "created_by": {"id": "user_123"},
+        "last_edited_by": {"id": "user_456"}
+    }
+
+
+@pytest.fixture(scope="module")
+def sample_database_response():
+    """Database as returned by the Notion API (read-only, shared across the module)."""
+    return {
+        "object": "database",
+        "id": "db_123",
+        "title": [{"plain_text": "Tasks Database"}],
+        "properties": {
+            "Name": {"type": "title"},
+            "Status": {"type": "select"}
+        },
+        "parent": {"type": "page_id", "page_id": "page_123"},
+        "url": "https://notion.so/db_123",
+        "archived": False,
+        "created_time": "2025-01-01T00:00:00.000Z",
+        "last_edited_time": "2025-01-01T00:00:00.000Z"
+    }
+
+
+@pytest.fixture(scope="module")
+def sample_db_entry_response():
+    """Database entry page as returned by the Notion API (read-only, shared across the module)."""
+    return {
+        "object": "page",
+        "id": "entry_123",
+        "parent": {"type": "database_id", "database_id": "db_123"},
+        "properties": {
+            "Name": {
+                "type": "title",
+                "title": [{"plain_text": "Task 1"}]
+            },
+            "Status": {
+                "type": "select",
+                "select": {"name": "In Progress"}
+            }
+        },
+        "url": "https://notion.so/entry_123",
+        "created_time": "2025-01-01T00:00:00.000Z",
+        "last_edited_time": "2025-01-01T00:00:00.000Z"
+    }
+
+
+@pytest.fixture(scope="module")
+def sample_block_response():
+    """Paragraph block as returned by the Notion API (read-only, shared across the module)."""
+    return {
+        "object": "block",
+        "id": "block_123",
+        "type": "paragraph",
+        "paragraph": {
+            "rich_text": [{"plain_text": "Test content"}],
+            "color": "default"
+        },
+        "has_children": False,
+        "created_time": "2025-01-01T00:00:00.000Z",
+        "last_edited_time": "2025-01-01T00:00:00.000Z",
+        "archived": False
+    }
@@ -2,9 +2,8 @@
 Unit tests for Notion client.
 """
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-from datetime import datetime
-from tenacity import RetryError
+from operator import attrgetter
+from unittest.mock import AsyncMock, patch
 
 from app.infrastructure.connectors.notion.client import NotionClient
 from app.domain.entities.notion_page import NotionPageDraft, NotionPageSearchCriteria
@@ -15,66 +14,137 @@ from app.domain.entities.notion_database import (
 from app.domain.entities.notion_block import NotionBlockDraft
 
 
-@pytest.fixture
+# (client method, AsyncClient endpoint, argument, API response, expected ID)
+CREATE_CASES = [
+    pytest.param(
+        "create_page",
+        "pages.create",
+        NotionPageDraft(
+            title="Test Page",
+            parent_id="parent_123",
+            parent_type="page_id"
+        ),
+        {"id": "page_123"},
+        "page_123",
+        id="create_page"
+    ),
+    pytest.param(
+        "create_database_entry",
+        "pages.create",
+        NotionDatabaseEntryDraft(
+            database_id="db_123",
+            properties={
+                "Name": {
+                    "title": [{"text": {"content": "New Entry"}}]
+                }
+            }
+        ),
+        {"id": "entry_123"},
+        "entry_123",
+        id="create_database_entry"
+    ),
+]
+
+# (client method, AsyncClient endpoint, argument, result fixture, expected entity IDs)
+LIST_CASES = [
+    pytest.param(
+        "search",
+        "search",
+        NotionPageSearchCriteria(query="test", filter_type="page"),
+        "sample_page_response",
+        ["page_123"],
+        id="search"
+    ),
+    pytest.param(
+        "query_database",
+        "databases.query",
+        NotionDatabaseQuery(
+            database_id="db_123",
+            filter={"property": "Status", "select": {"equals": "Active"}}
+        ),
+        "sample_db_entry_response",
+        ["entry_123"],
+        id="query_database"
+    ),
+    pytest.param(
+        "get_block_children",
+        "blocks.children.list",
+        "page_123",
+        "sample_block_response",
+        ["block_123"],
+        id="get_block_children"
+    ),
+]
+
+
+def mock_endpoint(notion_client, endpoint, **kwargs):
+    """Replace a dotted AsyncClient endpoint (e.g. 'pages.create') with an AsyncMock."""
+    parent_path, _, name = endpoint.rpartition(".")
+    parent = attrgetter(parent_path)(notion_client.client) if parent_path else notion_client.client
+    mock = AsyncMock(**kwargs)
+    setattr(parent, name, mock)
+    return mock
+
+
+@pytest.fixture(scope="module")
 def mock_notion_api():
-    """Mock Notion AsyncClient."""
+    """Mock Notion AsyncClient once per module."""
     with patch("app.infrastructure.connectors.notion.client.AsyncClient") as mock:
         yield mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def notion_client(mock_notion_api):
-    """Create NotionClient with mocked API."""
+    """
+    Create NotionClient with mocked API, shared across the module.
+
+    Tests only swap endpoints on the mocked AsyncClient; _reset_client_mocks
+    clears them after each test.
+    """
     with patch("app.config.settings.settings.notion_api_key", "test_key"):
         client = NotionClient(api_key="test_key")
         return client
 
 
+@pytest.fixture(autouse=True)
+def _reset_client_mocks(notion_client):
+    """Reset the shared AsyncClient mock so call counts stay per-test."""
+    yield
+    notion_client.client.reset_mock(return_value=True, side_effect=True)
+
+
 class TestNotionClient:
     """Test NotionClient class."""
 
-    @pytest.mark.asyncio
-    async def test_create_page(self, notion_client):
-        """Test creating a page."""
-        # Mock response
-        notion_client.client.pages.create = AsyncMock(
-            return_value={"id": "page_123"}
-        )
+    @pytest.mark.parametrize("method,endpoint,argument,response,expected_id", CREATE_CASES)
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_create_returns_id(self, notion_client, method, endpoint, argument, response, expected_id):
+        """Test creating a page or database entry returns the new ID."""
+        api_call = mock_endpoint(notion_client, endpoint, return_value=response)
 
-        # Create draft
-        draft = NotionPageDraft(
-            title="Test Page",
-            parent_id="parent_123",
-            parent_type="page_id"
-        )
+        result = await getattr(notion_client, method)(argument)
 
-        # Execute
-        page_id = await notion_client.create_page(draft)
+        assert result == expected_id
+        api_call.assert_called_once()
 
-        # Assert
-        assert page_id == "page_123"
-        notion_client.client.pages.create.assert_called_once()
+    @pytest.mark.parametrize("method,endpoint,argument,result_fixture,expected_ids", LIST_CASES)
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_list_returns_entities(
+        self, request, notion_client, method, endpoint, argument, result_fixture, expected_ids
+    ):
+        """Test list endpoints map every result to an entity."""
+        response = {"results": [request.getfixturevalue(result_fixture)]}
+        api_call = mock_endpoint(notion_client, endpoint, return_value=response)
 
-    @pytest.mark.asyncio
-    async def test_get_page(self, notion_client):
-        """Test getting a page."""
-        # Mock response
-        mock_response = {
-            "id": "page_123",
-            "properties": {
-                "title": {
-                    "type": "title",
-                    "title": [{"plain_text": "Test Page"}]
-                }
-            },
-            "parent": {"type": "page_id", "page_id": "parent_123"},
-            "url": "https://notion.so/page_123",
-            "archived": False,
-            "created_time": "2025-01-01T00:00:00.000Z",
-            "last_edited_time": "2025-01-01T00:00:00.000Z"
-        }
+        entities = await getattr(notion_client, method)(argument)
 
-        notion_client.client.pages.retrieve = AsyncMock(return_value=mock_response)
+        assert [entity.id for entity in entities] == expected_ids
+        api_call.assert_called_once()
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_get_page(self, notion_client, sample_page_response):
+        """Test getting a page."""
+        notion_client.client.pages.retrieve = AsyncMock(return_value=sample_page_response)
 
         # Execute
         page = await notion_client.get_page("page_123")
@@ -85,22 +155,18 @@ class TestNotionClient:
         assert page.parent_id == "parent_123"
         notion_client.client.pages.retrieve.assert_called_once_with(page_id="page_123")
 
-    @pytest.mark.asyncio
-    async def test_update_page(self, notion_client):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_update_page(self, notion_client, sample_page_response):
         """Test updating a page."""
-        # Mock response
+        # Shallow copy with new properties; the shared fixture stays untouched
         mock_response = {
-            "id": "page_123",
+            **sample_page_response,
             "properties": {
                 "title": {
                     "type": "title",
                     "title": [{"plain_text": "Updated Page"}]
                 }
-            },
-            "parent": {"type": "page_id", "page_id": "parent_123"},
-            "archived": False,
-            "created_time": "2025-01-01T00:00:00.000Z",
-            "last_edited_time": "2025-01-01T00:00:00.000Z"
+            }
         }
 
         notion_client.client.pages.update = AsyncMock(return_value=mock_response)
@@ -117,140 +183,7 @@ class TestNotionClient:
         assert page.title == "Updated Page"
         notion_client.client.pages.update.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_search(self, notion_client):
-        """Test searching pages."""
-        # Mock response
-        mock_response = {
-            "results": [
-                {
-                    "object": "page",
-                    "id": "page_123",
-                    "properties": {
-                        "title": {
-                            "type": "title",
-                            "title": [{"plain_text": "Test Page"}]
-                        }
-                    },
-                    "parent": {"type": "page_id", "page_id": "parent_123"},
-                    "archived": False,
-                    "created_time": "2025-01-01T00:00:00.000Z",
-                    "last_edited_time": "2025-01-01T00:00:00.000Z"
-                }
-            ]
-        }
-
-        notion_client.client.search = AsyncMock(return_value=mock_response)
-
-        # Create criteria
-        criteria = NotionPageSearchCriteria(
-            query="test",
-            filter_type="page"
-        )
-
-        # Execute
-        pages = await notion_client.search(criteria)
-
-        # Assert
-        assert len(pages) == 1
-        assert pages[0].id == "page_123"
-        assert pages[0].title == "Test Page"
-        notion_client.client.search.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_query_database(self, notion_client):
-        """Test querying a database."""
-        # Mock response
-        mock_response = {
-            "results": [
-                {
-                    "id": "entry_123",
-                    "parent": {"type": "database_id", "database_id": "db_123"},
-                    "properties": {
-                        "Name": {
-                            "type": "title",
-                            "title": [{"plain_text": "Entry 1"}]
-                        }
-                    },
-                    "created_time": "2025-01-01T00:00:00.000Z",
-                    "last_edited_time": "2025-01-01T00:00:00.000Z"
-                }
-            ]
-        }
-
-        notion_client.client.databases.query = AsyncMock(return_value=mock_response)
-
-        # Create query
-        query = NotionDatabaseQuery(
-            database_id="db_123",
-            filter={"property": "Status", "select": {"equals": "Active"}}
-        )
-
-        # Execute
-        entries = await notion_client.query_database(query)
-
-        # Assert
-        assert len(entries) == 1
-        assert entries[0].id == "entry_123"
-        assert entries[0].database_id == "db_123"
-        notion_client.client.databases.query.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_create_database_entry(self, notion_client):
-        """Test creating a database entry."""
-        # Mock response
-        notion_client.client.pages.create = AsyncMock(
-            return_value={"id": "entry_123"}
-        )
-
-        # Create draft
-        draft = NotionDatabaseEntryDraft(
-            database_id="db_123",
-            properties={
-                "Name": {
-                    "title": [{"text": {"content": "New Entry"}}]
-                }
-            }
-        )
-
-        # Execute
-        entry_id = await notion_client.create_database_entry(draft)
-
-        # Assert
-        assert entry_id == "entry_123"
-        notion_client.client.pages.create.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_get_block_children(self, notion_client):
-        """Test getting block children."""
-        # Mock response
-        mock_response = {
-            "results": [
-                {
-                    "id": "block_123",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [{"plain_text": "Test content"}]
-                    },
-                    "has_children": False,
-                    "created_time": "2025-01-01T00:00:00.000Z",
-                    "last_edited_time": "2025-01-01T00:00:00.000Z"
-                }
-            ]
-        }
-
-        notion_client.client.blocks.children.list = AsyncMock(return_value=mock_response)
-
-        # Execute
-        blocks = await notion_client.get_block_children("page_123")
-
-        # Assert
-        assert len(blocks) == 1
-        assert blocks[0].id == "block_123"
-        assert blocks[0].type == "paragraph"
-        notion_client.client.blocks.children.list.assert_called_once()
-
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_append_blocks(self, notion_client):
         """Test appending blocks."""
         # Mock response
@@ -280,7 +213,7 @@ class TestNotionClient:
         assert block_ids[1] == "block_456"
         notion_client.client.blocks.children.append.assert_called_once()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_create_page_error_handling(self, notion_client):
         """Test error handling when creating a page."""
         # Mock error
@@ -3,7 +3,6 @@ Unit tests for WhatsApp client.
 """
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
-from datetime import datetime
 
 from app.infrastructure.connectors.whatsapp.client import WhatsAppClient
 from app.domain.entities.whatsapp_message import WhatsAppMedia
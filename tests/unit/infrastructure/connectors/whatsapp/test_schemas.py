@@ -1,8 +1,6 @@
 """
 Unit tests for WhatsApp schemas and mappers.
 """
-import pytest
-from datetime import datetime
 
 from app.infrastructure.connectors.whatsapp.schemas import (
     WhatsAppMessageMapper,
@@ -17,9 +15,7 @@ from tests.fixtures.whatsapp_fixtures import (
     SAMPLE_WEBHOOK_TEXT_MESSAGE,
     SAMPLE_WEBHOOK_IMAGE_MESSAGE,
     SAMPLE_WEBHOOK_STATUS_UPDATE,
-    SAMPLE_TEMPLATES_RESPONSE,
-    create_sample_message_draft,
-    create_sample_media
+    SAMPLE_TEMPLATES_RESPONSE
 )
 
 